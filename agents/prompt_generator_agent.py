@@ -6,6 +6,7 @@ the Strategic Content Architect persona from system_prompts.md.
 
 from pathlib import Path
 from typing import Dict, Any
+import re
 
 from core.envelope import ok, err, validate_envelope
 from core.errors import ValidationError, ModelError
@@ -18,6 +19,28 @@ from core.cost_tracking import CostMetrics
 
 STEP_CODE = "25_structured_prompt"
 
+# Headings every structured prompt must contain
+REQUIRED_SECTIONS = (
+    "**Topic:**",
+    "**Target Audience:**",
+    "**Audience's Core Pain Point:**",
+    "**Key Metrics/Facts:**",
+    "**The Simple Solution/Code Snippet:**",
+)
+
+# Clichéd analogies rejected per persona guidelines
+CLICHE_PHRASES = (
+    "distributed ledger",
+    "like a library",
+    "like a recipe",
+    "like building a house",
+    "tip of the iceberg",
+)
+# Single alternation compiled once so each validation is one pass over the text
+CLICHE_PATTERN = re.compile(
+    "|".join(re.escape(phrase) for phrase in CLICHE_PHRASES), re.IGNORECASE
+)
+
 
 def _merge_token_usage(*usages: Dict[str, Any]) -> Dict[str, int]:
     """Combine token usage dictionaries by summing prompt/completion tokens."""
@@ -37,33 +60,21 @@ def _validate_prompt_structure(prompt_text: str) -> None:
 
     Raises ValidationError if required sections are missing or clichés detected.
     """
-    required_sections = [
-        "**Topic:**",
-        "**Target Audience:**",
-        "**Audience's Core Pain Point:**",
-        "**Key Metrics/Facts:**",
-        "**The Simple Solution/Code Snippet:**",
-    ]
-
-    missing = [section for section in required_sections if section not in prompt_text]
+    missing = [section for section in REQUIRED_SECTIONS if section not in prompt_text]
     if missing:
-        raise ValidationError(f"Prompt missing required sections: {missing}")
+        raise ValidationError(
+            f"Prompt missing required sections: {missing}",
+            error_code="MISSING_SECTIONS",
+        )
 
     # Check for clichéd analogies (per persona guidelines)
-    cliche_phrases = [
-        "distributed ledger",
-        "like a library",
-        "like a recipe",
-        "like building a house",
-        "tip of the iceberg",
-    ]
-
-    prompt_lower = prompt_text.lower()
-    found_cliches = [phrase for phrase in cliche_phrases if phrase in prompt_lower]
+    matched = {m.group(0).lower() for m in CLICHE_PATTERN.finditer(prompt_text)}
+    found_cliches = [phrase for phrase in CLICHE_PHRASES if phrase in matched]
     if found_cliches:
         raise ValidationError(
             f"Prompt contains clichéd analogies: {found_cliches}. "
-            "Strategic Content Architect must use fresh, unexpected analogies."
+            "Strategic Content Architect must use fresh, unexpected analogies.",
+            error_code="CLICHE_DETECTED",
         )
 
 
@@ -133,7 +144,7 @@ Please transform this into the structured prompt format as defined in your instr
     try:
         _validate_prompt_structure(prompt_text)
     except ValidationError as exc:
-        if "missing required sections" not in str(exc).lower():
+        if exc.error_code != "MISSING_SECTIONS":
             raise
 
         # Attempt a single self-repair pass to fill missing headings
@@ -239,7 +250,12 @@ def run(input_obj: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         return response
 
     except ValidationError as e:
-        response = err(type(e).__name__, str(e), retryable=e.retryable)
+        response = err(
+            type(e).__name__,
+            str(e),
+            retryable=e.retryable,
+            error_code=e.error_code,
+        )
         validate_envelope(response)
         log_event(
             run_id, "prompt_generator", attempt, "error", error_type=type(e).__name__
@@ -27,7 +27,8 @@ BLACKLIST_PATTERN = re.compile(
 
 def count_chars(text: str) -> int:
     """Count characters excluding line breaks."""
-    return len(text.replace("\n", "").replace("\r", ""))
+    # Subtract line-break counts rather than building a stripped copy
+    return len(text) - text.count("\n") - text.count("\r")
 
 
 def _remove_hashtags(text: str) -> str:
@@ -193,6 +194,9 @@ def run(input_obj: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
 
     Input contract:
         - draft_text (required): Draft text to review
+        - skip_llm_review (optional): Skip the first LLM coherence pass for a
+          draft the writer already self-critiqued; shortening retries still
+          use the LLM
 
     Output contract:
         - original: Original draft text
@@ -214,6 +218,7 @@ def run(input_obj: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
     run_path: Path = context["run_path"]
     cost_tracker = context.get("cost_tracker")
     draft_text = input_obj.get("draft_text")
+    skip_llm_review = bool(input_obj.get("skip_llm_review"))
 
     attempt = 1
     shortening_attempts = 0
@@ -228,12 +233,15 @@ def run(input_obj: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         # Shortening loop
         while shortening_attempts <= MAX_SHORTENING_ATTEMPTS:
             # Step 1: LLM Coherence Review (includes internal budget check)
-            llm_revised, token_usage = _llm_coherence_review(
-                draft_text, shortening_instruction, cost_tracker
-            )
+            if skip_llm_review and shortening_attempts == 0:
+                llm_revised, token_usage = draft_text, None
+            else:
+                llm_revised, token_usage = _llm_coherence_review(
+                    draft_text, shortening_instruction, cost_tracker
+                )
 
             # Record cost
-            if cost_tracker:
+            if cost_tracker and token_usage is not None:
                 # Use new positional calling pattern: (model, prompt_tokens, completion_tokens, agent_name)
                 cost_tracker.record_call(
                     "gemini-2.5-pro",
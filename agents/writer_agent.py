@@ -8,9 +8,13 @@ Strategic planning is now handled by the Prompt Generator Agent
 
 from pathlib import Path
 from typing import Dict, Any
+import math
+import operator
 import re
 import time
 
+import orjson
+
 from core.envelope import ok, err, validate_envelope
 from core.errors import ValidationError, ModelError
 from core.persistence import atomic_write_text
@@ -23,6 +27,39 @@ STEP_CODE = "40_draft"
 MAX_CHAR_COUNT = 3000
 MAX_SHORTENING_ATTEMPTS = 3
 TEMPERATURE = 0.8  # Higher temperature for creative writing
+# Output budget: a maximum-length post (~3.2 chars per token) plus headroom
+# for gemini-2.5-pro's thinking tokens, which count against max_output_tokens.
+# A reply that still hits the cap is rejected by the client as a ModelError.
+CHARS_PER_TOKEN = 3.2
+POST_OUTPUT_TOKENS = math.ceil(MAX_CHAR_COUNT / CHARS_PER_TOKEN)
+THINKING_TOKEN_ALLOWANCE = 8192
+MAX_OUTPUT_TOKENS = POST_OUTPUT_TOKENS + THINKING_TOKEN_ALLOWANCE
+# Self-critique mode: the draft and a 0-1 self-assessment come back as one
+# JSON object, so the orchestrator can skip the separate LLM review pass.
+# JSON quoting adds a little overhead on top of the plain-draft budget.
+SELF_CRITIQUE_MIME_TYPE = "application/json"
+SELF_CRITIQUE_OUTPUT_TOKENS = MAX_OUTPUT_TOKENS + 128
+SELF_CRITIQUE_INSTRUCTIONS = """
+
+**Output Format:**
+Before answering, critique your draft as a meticulous editor would \
+(coherence, persona consistency, grammar, character limit) and fix what you find.
+Return ONLY a JSON object of the form
+{"draft": "<the complete LinkedIn post>", "self_critique_score": <0.0-1.0>}
+where self_critique_score is your confidence that the draft needs no further editing."""
+
+# Legacy dict-form structured prompt fields and their fallbacks; the
+# itemgetter extracts them in this order in a single call
+LEGACY_PROMPT_DEFAULTS = {
+    "topic_title": "Unknown Topic",
+    "target_audience": "technical professionals",
+    "pain_point": "",
+    "key_metrics": [],
+    "analogy": "",
+    "solution_outline": "",
+    "code_snippet": "",
+}
+_LEGACY_PROMPT_FIELDS = operator.itemgetter(*LEGACY_PROMPT_DEFAULTS)
 BLACKLIST_PATTERN = re.compile(
     r"\s*[-—–]?\s*Tech Audience Accelerator\s*", re.IGNORECASE
 )
@@ -30,7 +67,8 @@ BLACKLIST_PATTERN = re.compile(
 
 def count_chars(text: str) -> int:
     """Count characters excluding line breaks."""
-    return len(text.replace("\n", "").replace("\r", ""))
+    # Subtract line-break counts rather than building a stripped copy
+    return len(text) - text.count("\n") - text.count("\r")
 
 
 def _format_structured_prompt_as_user_message(structured: str | Dict[str, Any]) -> str:
@@ -49,13 +87,15 @@ def _format_structured_prompt_as_user_message(structured: str | Dict[str, Any])
         return structured
 
     # Legacy path: If it's a dict with individual fields (for backward compatibility)
-    topic = structured.get("topic_title", "Unknown Topic")
-    audience = structured.get("target_audience", "technical professionals")
-    pain_point = structured.get("pain_point", "")
-    key_metrics = structured.get("key_metrics", [])
-    analogy = structured.get("analogy", "")
-    solution = structured.get("solution_outline", "")
-    code_snippet = structured.get("code_snippet", "")
+    (
+        topic,
+        audience,
+        pain_point,
+        key_metrics,
+        analogy,
+        solution,
+        code_snippet,
+    ) = _LEGACY_PROMPT_FIELDS({**LEGACY_PROMPT_DEFAULTS, **structured})
 
     # Build comprehensive user message
     user_message = f"""Generate a LinkedIn post using the Witty Expert persona.
@@ -90,6 +130,22 @@ Generate the complete LinkedIn post now."""
     return user_message
 
 
+def _format_shortening_request(previous_draft: str) -> str:
+    """Build the user message asking the LLM to shorten an over-long draft."""
+    return f"""**IMPORTANT: Character Count Issue**
+The previous draft is {count_chars(previous_draft)} characters (excluding line breaks); \
+the limit is {MAX_CHAR_COUNT}. Here it is:
+
+---
+{previous_draft}
+---
+
+Please regenerate the post with the SAME core message and structure, \
+but shorten it to under {MAX_CHAR_COUNT} characters (excluding line breaks). \
+Remove unnecessary elaboration, tighten phrasing, but preserve the hook, \
+analogy, metrics, and call to action. Return only the revised post."""
+
+
 def _scrub_blacklisted_phrases(text: str) -> tuple[str, int]:
     """Remove forbidden phrases (e.g., Tech Audience Accelerator) from text.
 
@@ -104,13 +160,18 @@ def _scrub_blacklisted_phrases(text: str) -> tuple[str, int]:
 
 
 def _generate_draft_with_llm(
-    structured: Dict[str, Any], shortening_context: str = None, cost_tracker=None
+    structured: Dict[str, Any],
+    shortening_context: str = None,
+    cost_tracker=None,
+    self_critique: bool = False,
 ) -> tuple[str, Dict[str, Any]]:
     """Generate LinkedIn post draft using Gemini LLM.
 
     Args:
         structured: Dict containing 'structured_prompt' key with the formatted prompt string
         shortening_context: Optional previous draft that was too long
+        self_critique: Ask for a JSON {"draft", "self_critique_score"} reply
+            instead of plain text (see _parse_self_critique)
 
     Returns:
         Tuple of (draft_text, token_usage dict)
@@ -121,28 +182,20 @@ def _generate_draft_with_llm(
     # Load Witty Expert persona from system_prompts.md
     system_prompt = load_system_prompt("witty_expert")
 
-    # Extract the structured_prompt string from the input dict
-    # (Prompt Generator Agent returns {"topic": "...", "structured_prompt": "..."})
-    structured_prompt_text = structured.get("structured_prompt", structured)
-
-    # Format structured prompt as user message
-    user_message = _format_structured_prompt_as_user_message(structured_prompt_text)
-
-    # If this is a shortening attempt, add context
     if shortening_context:
-        user_message = f"""{user_message}
+        # The previous draft already carries the structured prompt's content,
+        # so a shortening retry sends only the draft and the size target
+        user_message = _format_shortening_request(shortening_context)
+    else:
+        # Extract the structured_prompt string from the input dict
+        # (Prompt Generator Agent returns {"topic": "...", "structured_prompt": "..."})
+        structured_prompt_text = structured.get("structured_prompt", structured)
 
-**IMPORTANT: Character Count Issue**
-The previous draft was too long. Here it is:
+        # Format structured prompt as user message
+        user_message = _format_structured_prompt_as_user_message(structured_prompt_text)
 
----
-{shortening_context}
----
-
-Please regenerate the post with the SAME core message and structure, \
-but shorten it to under 3000 characters (excluding line breaks). \
-Remove unnecessary elaboration, tighten phrasing, but preserve the hook, \
-analogy, and metrics."""
+    if self_critique:
+        user_message += SELF_CRITIQUE_INSTRUCTIONS
 
     # Budget check with full prompt prior to LLM call
     if cost_tracker:
@@ -161,7 +214,11 @@ analogy, and metrics."""
             prompt=user_message,
             system_instruction=system_prompt,
             temperature=TEMPERATURE,
+            max_output_tokens=(
+                SELF_CRITIQUE_OUTPUT_TOKENS if self_critique else MAX_OUTPUT_TOKENS
+            ),
             use_search_grounding=False,
+            response_mime_type=SELF_CRITIQUE_MIME_TYPE if self_critique else None,
         )
         draft_text = response["text"]
 
@@ -177,6 +234,26 @@ analogy, and metrics."""
         raise ModelError(f"LLM generation failed: {str(e)}")
 
 
+def _parse_self_critique(text: str) -> tuple[str, float | None]:
+    """Split a self-critique JSON reply into (draft, score).
+
+    Replies that are not the expected JSON object are treated as a plain
+    draft with no score, so the caller falls back to a full review.
+    """
+    try:
+        payload = orjson.loads(text)
+        draft = payload["draft"]
+        score = payload.get("self_critique_score")
+    except (orjson.JSONDecodeError, TypeError, KeyError, AttributeError):
+        return text, None
+
+    if not isinstance(draft, str) or not draft.strip():
+        return text, None
+    if isinstance(score, bool) or not isinstance(score, (int, float)):
+        score = None
+    return draft.strip(), score
+
+
 def _generate_fallback_post(structured: Dict[str, Any]) -> str:
     """Generate a deterministic short post when LLM is unavailable.
 
@@ -223,9 +300,13 @@ def run(input_obj: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
     Input contract:
         - structured_prompt (required): Structured prompt from Prompt Generator Agent
         - shortening_instruction (optional): External shortening request from orchestrator
+        - self_critique (optional): Request the draft and a self-assessment in
+          one JSON-mode call
 
     Output contract:
         - draft_path: Path to saved draft markdown file
+        - self_critique_score (self_critique only): 0-1 self-assessment, or
+          None if the reply could not be parsed
 
     Internal logic:
         - Generates draft with LLM (Witty Expert persona)
@@ -239,6 +320,8 @@ def run(input_obj: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
     structured = input_obj.get("structured_prompt")
     # external_shortening retained for future orchestrator-driven shortening; currently unused
     fallback_tracker = context.get("fallback_tracker")
+    self_critique = bool(input_obj.get("self_critique"))
+    self_critique_score = None
 
     attempt = 1
     shortening_attempts = 0
@@ -252,8 +335,10 @@ def run(input_obj: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         while shortening_attempts <= MAX_SHORTENING_ATTEMPTS:
             # Generate draft (includes internal budget check)
             draft, token_usage = _generate_draft_with_llm(
-                structured, previous_draft, cost_tracker
+                structured, previous_draft, cost_tracker, self_critique
             )
+            if self_critique:
+                draft, self_critique_score = _parse_self_critique(draft)
 
             # Remove any blacklisted phrases before further processing/persistence
             draft, blacklist_hits = _scrub_blacklisted_phrases(draft)
@@ -289,7 +374,10 @@ def run(input_obj: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
                 artifact_path = get_artifact_path(run_path, STEP_CODE, extension="md")
                 atomic_write_text(artifact_path, draft)
 
-                response = ok({"draft_path": str(artifact_path)})
+                data = {"draft_path": str(artifact_path)}
+                if self_critique:
+                    data["self_critique_score"] = self_critique_score
+                response = ok(data)
                 validate_envelope(response)
                 return response
 
@@ -5,23 +5,35 @@ Tracks token usage and costs across all agents during a run.
 Enforces per-run budget limits to prevent unexpected expenses.
 """
 
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Dict, Optional
+from typing import DefaultDict, Dict, Optional, Tuple
 import os
 
-try:
-    # Lazy import so unit tests can run without network; will fail gracefully
-    from google import genai as genai_new  # type: ignore
-
-    _COST_CLIENT = (
-        genai_new.Client(api_key=os.getenv("GOOGLE_API_KEY"))
-        if os.getenv("GOOGLE_API_KEY")
-        else None
-    )
-except Exception:  # pragma: no cover - defensive fallback
-    _COST_CLIENT = None
 from core.errors import ValidationError
 
+# Token-counting client, created by _get_cost_client on the first budget check
+# so importing this module does not pay for loading the google.genai SDK
+_COST_CLIENT = None
+_COST_CLIENT_LOADED = False
+
+
+def _get_cost_client():
+    """Return the token-counting client, or None if unavailable."""
+    global _COST_CLIENT, _COST_CLIENT_LOADED
+    if not _COST_CLIENT_LOADED:
+        _COST_CLIENT_LOADED = True
+        if os.getenv("GOOGLE_API_KEY"):
+            try:
+                # Imported here so unit tests can run without network; will
+                # fail gracefully
+                from google import genai as genai_new  # type: ignore
+
+                _COST_CLIENT = genai_new.Client(api_key=os.getenv("GOOGLE_API_KEY"))
+            except Exception:  # pragma: no cover - defensive fallback
+                _COST_CLIENT = None
+    return _COST_CLIENT
+
 
 # Gemini pricing (as of 11/25/2025, verify at https://ai.google.dev/pricing)
 # Prices are per 1M tokens (USD)
@@ -29,6 +41,29 @@ GEMINI_PRO_INPUT_PRICE = 1.25  # $1.25 per 1M input tokens
 GEMINI_PRO_OUTPUT_PRICE = 10.00  # $10.00 per 1M output tokens
 GEMINI_FLASH_IMAGE_PRICE = 0.30  # $0.30 per image (estimate)
 
+# (flat cost per call, USD per input token, USD per output token), derived
+# once from the prices above so costing a call is two multiplies and adds
+_PRO_RATES = (
+    0.0,
+    GEMINI_PRO_INPUT_PRICE / 1_000_000,
+    GEMINI_PRO_OUTPUT_PRICE / 1_000_000,
+)
+_IMAGE_RATES = (GEMINI_FLASH_IMAGE_PRICE, 0.0, 0.0)
+
+# Model name -> rates, filled on first use of each name
+_MODEL_RATES: Dict[str, Tuple[float, float, float]] = {}
+
+
+def _rates_for(model: str) -> Tuple[float, float, float]:
+    """Look up (or classify and cache) the pricing rates for ``model``."""
+    rates = _MODEL_RATES.get(model)
+    if rates is None:
+        # Image generation has fixed cost per image; text models (and
+        # unknown models, by default) use Pro token pricing
+        rates = _IMAGE_RATES if "image" in model.lower() else _PRO_RATES
+        _MODEL_RATES[model] = rates
+    return rates
+
 
 @dataclass
 class CostMetrics:
@@ -42,19 +77,10 @@ class CostMetrics:
 
     def __post_init__(self):
         """Calculate cost based on token usage and model."""
-        if "image" in self.model.lower():
-            # Image generation has fixed cost per image
-            self.cost_usd = GEMINI_FLASH_IMAGE_PRICE
-        elif "gemini" in self.model.lower() and "pro" in self.model.lower():
-            # Text generation cost based on tokens
-            input_cost = (self.input_tokens / 1_000_000) * GEMINI_PRO_INPUT_PRICE
-            output_cost = (self.output_tokens / 1_000_000) * GEMINI_PRO_OUTPUT_PRICE
-            self.cost_usd = input_cost + output_cost
-        else:
-            # Unknown model, use default Pro pricing
-            input_cost = (self.input_tokens / 1_000_000) * GEMINI_PRO_INPUT_PRICE
-            output_cost = (self.output_tokens / 1_000_000) * GEMINI_PRO_OUTPUT_PRICE
-            self.cost_usd = input_cost + output_cost
+        flat, input_rate, output_rate = _rates_for(self.model)
+        self.cost_usd = (
+            flat + self.input_tokens * input_rate + self.output_tokens * output_rate
+        )
 
 
 @dataclass
@@ -71,8 +97,14 @@ class CostTracker:
     # Internal state
     total_cost_usd: float = 0.0
     api_call_count: int = 0
-    costs_by_agent: Dict[str, float] = field(default_factory=dict)
-    calls_by_agent: Dict[str, int] = field(default_factory=dict)
+    costs_by_agent: DefaultDict[str, float] = field(
+        default_factory=lambda: defaultdict(float)
+    )
+    calls_by_agent: DefaultDict[str, int] = field(
+        default_factory=lambda: defaultdict(int)
+    )
+    # Highest threshold already warned about (costs only grow, so it holds)
+    _warned_at: Optional[float] = field(default=None, init=False, repr=False)
 
     def check_budget(
         self, model: str, prompt: str, estimated_output_tokens: int = 1000
@@ -96,9 +128,10 @@ class CostTracker:
 
         # Count input tokens using Gemini if available; fallback to heuristic
         input_tokens = 0
-        if _COST_CLIENT is not None:
+        cost_client = _get_cost_client()
+        if cost_client is not None:
             try:  # pragma: no branch
-                token_info = _COST_CLIENT.models.count_tokens(
+                token_info = cost_client.models.count_tokens(
                     model=model, contents=prompt
                 )
                 # Some client versions return dict-like, others object with total_tokens
@@ -162,6 +195,22 @@ class CostTracker:
         Raises:
             ValidationError: If budget limits would be exceeded
         """
+        if not kwargs:
+            # Fast path: purely positional calls need no keyword normalization
+            if isinstance(metrics_or_prompt_tokens, CostMetrics):
+                self._apply_metrics(agent_name_or_model, metrics_or_prompt_tokens)
+            else:
+                self._apply_metrics(
+                    agent_name,
+                    self._metrics_from_tokens(
+                        agent_name_or_model,
+                        metrics_or_prompt_tokens,
+                        completion_tokens,
+                        agent_name,
+                    ),
+                )
+            return
+
         # Normalize keyword-based calls for backward compatibility
         model_kw = kwargs.pop("model", None)
         prompt_tokens_kw = kwargs.pop("prompt_tokens", None)
@@ -188,34 +237,44 @@ class CostTracker:
         # Determine which calling pattern is being used
         if isinstance(prompt_or_metrics, CostMetrics) and model_kw is None:
             # Old pattern: record_call(agent_name, metrics)
-            agent = agent_name_or_model
-            metrics = prompt_or_metrics
+            self._apply_metrics(agent_name_or_model, prompt_or_metrics)
         else:
-            # New pattern: record_call(model, prompt_tokens, completion_tokens, agent_name)
-            if model is None or model == "":
-                raise ValidationError(
-                    "model must be provided when recording cost with token counts"
-                )
-
-            prompt_tokens = int(prompt_or_metrics) if prompt_or_metrics else 0
-            completion_tokens_val = (
-                int(completion_tokens_val) if completion_tokens_val else 0
+            self._apply_metrics(
+                agent,
+                self._metrics_from_tokens(
+                    model, prompt_or_metrics, completion_tokens_val, agent
+                ),
             )
 
-            # Validate that agent_name is provided when using new pattern
-            if not agent:
-                raise ValidationError(
-                    "agent_name must be provided when using new calling pattern: "
-                    "record_call(model, prompt_tokens, completion_tokens, agent_name)"
-                )
+    @staticmethod
+    def _metrics_from_tokens(
+        model: Optional[str],
+        prompt_tokens,
+        completion_tokens,
+        agent: Optional[str],
+    ) -> CostMetrics:
+        """Validate a token-count call and build its CostMetrics."""
+        # New pattern: record_call(model, prompt_tokens, completion_tokens, agent_name)
+        if model is None or model == "":
+            raise ValidationError(
+                "model must be provided when recording cost with token counts"
+            )
 
-            # Create cost metrics
-            metrics = CostMetrics(
-                model=model,
-                input_tokens=prompt_tokens,
-                output_tokens=completion_tokens_val,
+        # Validate that agent_name is provided when using new pattern
+        if not agent:
+            raise ValidationError(
+                "agent_name must be provided when using new calling pattern: "
+                "record_call(model, prompt_tokens, completion_tokens, agent_name)"
             )
 
+        return CostMetrics(
+            model=model,
+            input_tokens=int(prompt_tokens) if prompt_tokens else 0,
+            output_tokens=int(completion_tokens) if completion_tokens else 0,
+        )
+
+    def _apply_metrics(self, agent: Optional[str], metrics: CostMetrics) -> None:
+        """Enforce budget limits, then add ``metrics`` to the running totals."""
         # Check limits BEFORE recording
         if self.api_call_count >= self.max_api_calls:
             raise ValidationError(
@@ -238,10 +297,8 @@ class CostTracker:
 
         # Update per-agent tracking (if agent name provided)
         if agent:
-            self.costs_by_agent[agent] = (
-                self.costs_by_agent.get(agent, 0.0) + metrics.cost_usd
-            )
-            self.calls_by_agent[agent] = self.calls_by_agent.get(agent, 0) + 1
+            self.costs_by_agent[agent] += metrics.cost_usd
+            self.calls_by_agent[agent] += 1
 
     def get_summary(self) -> Dict[str, any]:
         """
@@ -256,7 +313,7 @@ class CostTracker:
             "costs_by_agent": {
                 agent: round(cost, 4) for agent, cost in self.costs_by_agent.items()
             },
-            "calls_by_agent": self.calls_by_agent.copy(),
+            "calls_by_agent": dict(self.calls_by_agent),
             "budget_remaining_usd": round(self.max_cost_usd - self.total_cost_usd, 4),
             "calls_remaining": self.max_api_calls - self.api_call_count,
         }
@@ -281,9 +338,10 @@ class CostTracker:
             Estimated cost in USD
         """
         # Text generation cost
-        text_cost_per_call = (avg_input_tokens / 1_000_000) * GEMINI_PRO_INPUT_PRICE + (
-            avg_output_tokens / 1_000_000
-        ) * GEMINI_PRO_OUTPUT_PRICE
+        _, input_rate, output_rate = _PRO_RATES
+        text_cost_per_call = (
+            avg_input_tokens * input_rate + avg_output_tokens * output_rate
+        )
         total_text_cost = text_cost_per_call * num_text_agents
 
         # Image generation cost
@@ -295,11 +353,17 @@ class CostTracker:
         """
         Log warning if cost exceeds threshold.
 
+        Warns once per threshold: repeat calls with the same or a lower
+        threshold return immediately after the first warning.
+
         Args:
             threshold: Warning threshold in USD
         """
+        if self._warned_at is not None and threshold <= self._warned_at:
+            return
         if self.total_cost_usd >= threshold:
             print(
                 f"⚠️  Warning: Run cost ${self.total_cost_usd:.4f} "
                 f"exceeds ${threshold:.2f} threshold"
             )
+            self._warned_at = threshold
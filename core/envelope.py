@@ -7,6 +7,10 @@ All agents must return a consistent structure for orchestration and error handli
 from dataclasses import dataclass, field, asdict
 from typing import Any, Optional, Dict
 
+# Schema constants for validate_envelope (built once at import, not per call)
+VALID_STATUSES = frozenset({"ok", "error"})
+REQUIRED_ERROR_FIELDS = ("type", "message", "retryable")
+
 
 @dataclass
 class AgentResponse:
@@ -51,7 +55,11 @@ def ok(data: dict, metrics: Optional[dict] = None) -> dict:
 
 
 def err(
-    error_type: str, message: str, retryable: bool, metrics: Optional[dict] = None
+    error_type: str,
+    message: str,
+    retryable: bool,
+    metrics: Optional[dict] = None,
+    error_code: Optional[str] = None,
 ) -> dict:
     """
     Create an error response envelope.
@@ -61,6 +69,7 @@ def err(
         message: Human-readable error description
         retryable: Whether the orchestrator should retry this operation
         metrics: Optional metrics captured before failure
+        error_code: Optional stable identifier, added as error["code"] when set
 
     Returns:
         Standardized error response dictionary
@@ -78,10 +87,14 @@ def err(
             "metrics": {"attempt": 2}
         }
     """
+    error = {"type": error_type, "message": message, "retryable": retryable}
+    if error_code is not None:
+        error["code"] = error_code
+
     response = AgentResponse(
         status="error",
         data={},
-        error={"type": error_type, "message": message, "retryable": retryable},
+        error=error,
         metrics=metrics,
     )
     return response.to_dict()
@@ -106,7 +119,7 @@ def validate_envelope(envelope: dict) -> bool:
     if "status" not in envelope:
         raise ValueError("Envelope missing required 'status' field")
 
-    if envelope["status"] not in ["ok", "error"]:
+    if envelope["status"] not in VALID_STATUSES:
         raise ValueError(f"Invalid status: {envelope['status']}")
 
     if "data" not in envelope:
@@ -117,8 +130,7 @@ def validate_envelope(envelope: dict) -> bool:
             raise ValueError("Error envelope must contain 'error' field")
 
         error = envelope["error"]
-        required_error_fields = ["type", "message", "retryable"]
-        for field_name in required_error_fields:
+        for field_name in REQUIRED_ERROR_FIELDS:
             if field_name not in error:
                 raise ValueError(f"Error object missing required field: {field_name}")
 
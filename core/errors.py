@@ -5,6 +5,8 @@ This module defines the error hierarchy used throughout the multi-agent pipeline
 Each error type has specific semantics for retry logic and error handling.
 """
 
+from typing import Optional
+
 
 class BaseAgentError(Exception):
     """Base exception class for all agent-related errors."""
@@ -36,10 +38,19 @@ class ValidationError(BaseAgentError):
     - Invalid JSON schema
 
     This error is NOT retryable as it indicates a logic issue.
+
+    An optional ``error_code`` gives callers a stable identifier to branch
+    on (e.g. "CLICHE_DETECTED") instead of matching message text.
     """
 
-    def __init__(self, message: str):
+    # B042: __reduce__ below rebuilds from both arguments; __str__ is inherited
+    def __init__(self, message: str, error_code: Optional[str] = None):  # noqa: B042
         super().__init__(message, retryable=False)
+        self.error_code = error_code
+
+    def __reduce__(self):
+        """Rebuild from (message, error_code) so pickle and copy keep the code."""
+        return type(self), (self.message, self.error_code), self.__dict__
 
 
 class DataNotFoundError(BaseAgentError):
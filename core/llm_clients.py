@@ -38,6 +38,21 @@ TEXT_MODEL = "gemini-2.5-pro"
 IMAGE_MODEL = "gemini-2.5-flash-image"
 
 
+def _ensure_complete(response: Any) -> None:
+    """Raise ModelError when a reply has no candidate or was cut off.
+
+    gemini-2.5-pro spends thinking tokens from the max_output_tokens budget,
+    so a tight cap can end a reply early or leave it without text. Both cases
+    surface as retryable errors instead of a truncated draft.
+    """
+    candidates = getattr(response, "candidates", None)
+    if not candidates:
+        raise ModelError("Model returned no candidates")
+    finish_reason = getattr(candidates[0], "finish_reason", None)
+    if getattr(finish_reason, "name", finish_reason) == "MAX_TOKENS":
+        raise ModelError("Model output stopped at max_output_tokens")
+
+
 class GeminiTextClient:
     """Client for Gemini text generation (gemini-2.5-pro)."""
 
@@ -58,6 +73,7 @@ class GeminiTextClient:
         max_output_tokens: Optional[int] = None,
         system_instruction: Optional[str] = None,
         use_search_grounding: bool = False,
+        response_mime_type: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Generate text from prompt with token usage tracking.
@@ -71,6 +87,8 @@ class GeminiTextClient:
             max_output_tokens: Maximum tokens to generate (optional)
             system_instruction: System prompt for persona/instructions
             use_search_grounding: Enable Google Search grounding (default: False)
+            response_mime_type: Output MIME type, e.g. "application/json"
+                for JSON mode (optional)
 
         Returns:
             Dict with keys:
@@ -122,6 +140,7 @@ class GeminiTextClient:
                 config = types.GenerateContentConfig(
                     temperature=temperature,
                     max_output_tokens=max_output_tokens,
+                    response_mime_type=response_mime_type,
                     tools=[grounding_tool],
                     system_instruction=system_instruction,
                 )
@@ -133,6 +152,8 @@ class GeminiTextClient:
                     config=config,
                 )
 
+                _ensure_complete(response)
+
                 # Extract token usage and grounding metadata
                 token_usage = {}
                 grounding_metadata = {}
@@ -170,6 +191,8 @@ class GeminiTextClient:
                 }
                 if max_output_tokens:
                     generation_config["max_output_tokens"] = max_output_tokens
+                if response_mime_type:
+                    generation_config["response_mime_type"] = response_mime_type
 
                 # Create model with system instruction if provided
                 if system_instruction:
@@ -184,6 +207,8 @@ class GeminiTextClient:
                     prompt, generation_config=generation_config
                 )
 
+                _ensure_complete(response)
+
                 # Extract token usage (if available)
                 token_usage = {}
                 if hasattr(response, "usage_metadata"):
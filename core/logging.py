@@ -11,6 +11,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional, Dict, Any
 
+import orjson
+
 # Thread lock for safe concurrent writes
 _log_lock = threading.Lock()
 
@@ -73,11 +75,13 @@ def log_event(
     if token_usage is not None:
         event["token_usage"] = token_usage
 
+    # Serialize the whole line up front so the append is a single write
+    line = orjson.dumps(event) + b"\n"
+
     # Thread-safe append to JSONL file
     with _log_lock:
-        with open(EVENTS_LOG_PATH, "a", encoding="utf-8") as f:
-            json.dump(event, f, ensure_ascii=False)
-            f.write("\n")
+        with open(EVENTS_LOG_PATH, "ab") as f:
+            f.write(line)
             f.flush()
 
 
@@ -5,24 +5,52 @@ All disk writes use the temp-file-then-rename pattern to prevent partial writes.
 JSON artifacts are immediately verified after writing to catch corruption early.
 """
 
-import json
+import itertools
 import os
-import tempfile
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from core.errors import CorruptionError
 
+# Pretty-printed output (matches the previous json.dump(indent=2) layout);
+# non-str keys are coerced to strings the way the stdlib json module does.
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+# Temp files are opened exclusively and in binary mode (no newline translation)
+_TEMP_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+_TEMP_COUNTER = itertools.count()
+
+# On Linux the temp file can be created unnamed (O_TMPFILE) and linked into
+# the directory only once fully written, so a failed write leaves no entry
+# to unlink. Cleared for the process the first time the open or link is
+# rejected (older kernels, some filesystems and sandboxes).
+_ANON_TEMP_FLAGS = os.O_WRONLY | getattr(os, "O_TMPFILE", 0)
+_use_anonymous_temp = hasattr(os, "O_TMPFILE") and os.path.isdir("/proc/self/fd")
+
+# Default for the ``durable`` argument of the write helpers. Durable writes
+# fsync the temp file before renaming; non-durable writes still rename
+# atomically but may lose the newest content on power failure. The test
+# suite switches this off (see tests/conftest.py).
+DURABLE_WRITES = True
 
-def atomic_write_json(path: str | Path, obj: Any) -> None:
+
+def atomic_write_json(
+    path: str | Path, obj: Any, *, durable: bool | None = None
+) -> None:
     """
     Write JSON to file atomically using temp file + rename pattern.
 
     This prevents partial writes if the process crashes mid-operation.
+    Non-durable writes skip the fsync, which is usually the slowest step:
+    readers still never see a partial file, but a power loss may leave the
+    previous version in place.
 
     Args:
         path: Target file path (absolute or relative)
         obj: Python object to serialize (must be JSON-serializable)
+        durable: fsync data before the rename (default: DURABLE_WRITES)
 
     Raises:
         OSError: If file operations fail
@@ -31,24 +59,86 @@ def atomic_write_json(path: str | Path, obj: Any) -> None:
     Example:
         >>> atomic_write_json("10_topic.json", {"topic": "Python asyncio"})
     """
+    # Serialize up front so an unserializable object never creates a temp file
+    _atomic_write_bytes(path, _dumps(obj), durable)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize ``obj`` to the canonical artifact JSON bytes."""
+    return orjson.dumps(obj, option=_JSON_OPTIONS)
+
+
+def _write_all(fd: int, payload: bytes) -> None:
+    """Write all of ``payload`` to ``fd``, resuming after partial writes."""
+    while payload:
+        written = os.write(fd, payload)
+        payload = payload[written:]
+
+
+def _write_anonymous_temp(temp_path: Path, payload: bytes, durable: bool) -> bool:
+    """Write ``payload`` to an unnamed file, then link it in as ``temp_path``.
+
+    Returns False (and disables the mechanism) when the platform rejects
+    it; write and fsync errors propagate with nothing left to clean up.
+    """
+    global _use_anonymous_temp
+    try:
+        fd = os.open(temp_path.parent, _ANON_TEMP_FLAGS, 0o644)
+    except OSError:
+        _use_anonymous_temp = False
+        return False
+    try:
+        _write_all(fd, payload)
+        if durable:
+            os.fsync(fd)  # Force write to disk
+        try:
+            os.link(f"/proc/self/fd/{fd}", temp_path)
+        except OSError:
+            _use_anonymous_temp = False
+            return False
+    finally:
+        os.close(fd)
+    return True
+
+
+def _write_named_temp(temp_path: Path, payload: bytes, durable: bool) -> None:
+    """Write ``payload`` to a new file at ``temp_path``, removing it on error."""
+    fd = os.open(temp_path, _TEMP_FLAGS, 0o644)
+    try:
+        try:
+            _write_all(fd, payload)
+            if durable:
+                os.fsync(fd)  # Force write to disk
+        finally:
+            os.close(fd)
+    except Exception:
+        # Clean up temp file on error
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _atomic_write_bytes(
+    path: str | Path, payload: bytes, durable: bool | None = None
+) -> None:
+    """Write ``payload`` to ``path`` via temp file + atomic rename."""
+    if durable is None:
+        durable = DURABLE_WRITES
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Write to temporary file in same directory (ensures same filesystem)
-    fd, temp_path = tempfile.mkstemp(
-        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
-    )
+    # Temp file in same directory (ensures same filesystem); pid + counter
+    # keep the name unique without tempfile's random-name probing
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.{next(_TEMP_COUNTER)}.tmp")
+    if not (_use_anonymous_temp and _write_anonymous_temp(temp_path, payload, durable)):
+        _write_named_temp(temp_path, payload, durable)
 
     try:
-        with os.fdopen(fd, "w", encoding="utf-8") as f:
-            json.dump(obj, f, indent=2, ensure_ascii=False)
-            f.flush()
-            os.fsync(f.fileno())  # Force write to disk
-
         # Atomic rename (overwrites destination on Windows/Unix)
         os.replace(temp_path, path)
     except Exception:
-        # Clean up temp file on error
         try:
             os.unlink(temp_path)
         except OSError:
@@ -56,13 +146,16 @@ def atomic_write_json(path: str | Path, obj: Any) -> None:
         raise
 
 
-def atomic_write_text(path: str | Path, text: str) -> None:
+def atomic_write_text(
+    path: str | Path, text: str, *, durable: bool | None = None
+) -> None:
     """
     Write text to file atomically using temp file + rename pattern.
 
     Args:
         path: Target file path (absolute or relative)
         text: String content to write
+        durable: fsync data before the rename (default: DURABLE_WRITES)
 
     Raises:
         OSError: If file operations fail
@@ -70,26 +163,7 @@ def atomic_write_text(path: str | Path, text: str) -> None:
     Example:
         >>> atomic_write_text("60_final_post.txt", "My LinkedIn post content...")
     """
-    path = Path(path)
-    path.parent.mkdir(parents=True, exist_ok=True)
-
-    fd, temp_path = tempfile.mkstemp(
-        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
-    )
-
-    try:
-        with os.fdopen(fd, "w", encoding="utf-8") as f:
-            f.write(text)
-            f.flush()
-            os.fsync(f.fileno())
-
-        os.replace(temp_path, path)
-    except Exception:
-        try:
-            os.unlink(temp_path)
-        except OSError:
-            pass
-        raise
+    _atomic_write_bytes(path, text.encode("utf-8"), durable)
 
 
 def verify_json(path: str | Path) -> dict:
@@ -114,25 +188,31 @@ def verify_json(path: str | Path) -> dict:
     path = Path(path)
 
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return orjson.loads(path.read_bytes())
     except FileNotFoundError as e:
         raise CorruptionError(f"JSON file not found after write: {path}") from e
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         raise CorruptionError(f"JSON file corrupted at {path}: {e}") from e
     except OSError as e:
         raise CorruptionError(f"Cannot read JSON file at {path}: {e}") from e
 
 
-def write_and_verify_json(path: str | Path, obj: Any) -> dict:
+def write_and_verify_json(
+    path: str | Path, obj: Any, *, durable: bool | None = None
+) -> dict:
     """
     Write JSON file atomically and immediately verify integrity.
 
     This is the recommended method for all agent artifact persistence.
+    Verification re-reads the file and compares it byte-for-byte with the
+    serialized payload; on a match the payload itself is parsed, otherwise
+    the file is. Either way the caller gets a fresh parsed copy (tuples
+    come back as lists, non-str keys as strings), never ``obj`` itself.
 
     Args:
         path: Target file path
         obj: Python object to serialize
+        durable: fsync data before the rename (default: DURABLE_WRITES)
 
     Returns:
         The verified, parsed JSON object
@@ -145,26 +225,23 @@ def write_and_verify_json(path: str | Path, obj: Any) -> dict:
     Example:
         >>> result = write_and_verify_json("20_research.json", {"sources": [...]})
     """
-    atomic_write_json(path, obj)
-    return verify_json(path)
-
-
-def count_chars(text: str) -> int:
-    """
-    Count characters in text for LinkedIn post validation.
+    payload = _dumps(obj)
+    _atomic_write_bytes(path, payload, durable)
 
-    LinkedIn has a ~3000 character limit for posts.
+    try:
+        if Path(path).read_bytes() == payload:
+            return orjson.loads(payload)
+    except OSError:
+        pass  # verify_json below reports the read failure
+    return verify_json(path)
 
-    Args:
-        text: Post content to count
 
-    Returns:
-        Number of characters (including whitespace)
-
-    Example:
-        >>> count_chars("Hello, world!")
-        13
-        >>> count_chars("Line 1\\nLine 2")
-        13
-    """
-    return len(text)
+# Count characters in text for LinkedIn post validation (~3000 char limit).
+# Whitespace and newlines are included, so this is exactly len(); binding the
+# builtin directly avoids a Python frame on every length check.
+#
+#     >>> count_chars("Hello, world!")
+#     13
+#     >>> count_chars("Line 1\nLine 2")
+#     13
+count_chars = len
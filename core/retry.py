@@ -63,11 +63,17 @@ def _is_quota_or_rate_limit_error(message: str) -> bool:
     return any(keyword in lowered for keyword in keywords)
 
 
+# Largest backoff exponent: 2^30 base delays, far past any real retry budget
+_MAX_BACKOFF_SHIFT = 30
+
+
 def exponential_backoff(attempt: int, base_seconds: float = 1.0) -> float:
     """
     Calculate exponential backoff delay.
 
-    Formula: base_seconds * 2^(attempt - 1)
+    Formula: base_seconds * 2^(attempt - 1), computed as a bit shift. The
+    exponent is clamped to [0, 30] so a runaway attempt count cannot grow
+    the delay without bound.
 
     Args:
         attempt: Current attempt number (1-indexed)
@@ -84,7 +90,8 @@ def exponential_backoff(attempt: int, base_seconds: float = 1.0) -> float:
         >>> exponential_backoff(3)  # Third retry
         4.0
     """
-    return base_seconds * (2 ** (attempt - 1))
+    shift = min(max(attempt - 1, 0), _MAX_BACKOFF_SHIFT)
+    return base_seconds * (1 << shift)
 
 
 def execute_with_retries(
@@ -92,6 +99,7 @@ def execute_with_retries(
     max_attempts: int = 3,
     circuit_breaker: CircuitBreaker | None = None,
     base_delay: float = 1.0,
+    sleep_fn: Callable[[float], None] | None = None,
 ) -> T:
     """
     Execute function with automatic retries for retryable errors.
@@ -104,6 +112,8 @@ def execute_with_retries(
         max_attempts: Maximum number of attempts (default: 3)
         circuit_breaker: Optional circuit breaker instance for failure tracking
         base_delay: Base delay for exponential backoff in seconds (default: 1.0)
+        sleep_fn: Called with each backoff delay (default: time.sleep, looked
+            up per call); tests pass a recorder instead of patching
 
     Returns:
         Result of func() if successful
@@ -157,7 +167,7 @@ def execute_with_retries(
 
             # Exponential backoff
             delay = exponential_backoff(attempt, base_delay)
-            time.sleep(delay)
+            (sleep_fn or time.sleep)(delay)
 
         except Exception:
             # Unexpected errors are not retried
@@ -11,10 +11,19 @@ Provides structured access to persona definitions for:
 from pathlib import Path
 from typing import Dict
 
-
 # Cache loaded prompts to avoid repeated file I/O
 _PROMPT_CACHE: Dict[str, str] = {}
 
+# Cache raw file contents so loading several sections reads the file once
+_FILE_CACHE: Dict[Path, str] = {}
+
+
+def _read_prompts_file(path: Path) -> str:
+    """Return the text of ``path``, reading it from disk only once."""
+    if path not in _FILE_CACHE:
+        _FILE_CACHE[path] = path.read_text(encoding="utf-8")
+    return _FILE_CACHE[path]
+
 
 def load_system_prompt(section_name: str) -> str:
     """
@@ -62,11 +71,11 @@ def load_system_prompt(section_name: str) -> str:
     # Locate system_prompts.md
     system_prompts_path = Path(__file__).parent.parent / "system_prompts.md"
 
-    if not system_prompts_path.exists():
+    if system_prompts_path not in _FILE_CACHE and not system_prompts_path.exists():
         raise FileNotFoundError(f"system_prompts.md not found at {system_prompts_path}")
 
-    # Read file and extract section
-    content = system_prompts_path.read_text(encoding="utf-8")
+    # Read file (once) and extract section
+    content = _read_prompts_file(system_prompts_path)
     start_marker, end_marker = section_markers[section_name]
 
     # Find section boundaries
@@ -89,8 +98,9 @@ def load_system_prompt(section_name: str) -> str:
 
 
 def clear_cache():
-    """Clear the prompt cache. Useful for testing."""
+    """Clear the prompt and file caches. Useful for testing."""
     _PROMPT_CACHE.clear()
+    _FILE_CACHE.clear()
 
 
 # Convenience functions for specific personas
@@ -1,22 +1,37 @@
 import argparse
 import os
 import sqlite3
-from typing import Iterable, Tuple
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Tuple
 
 DEFAULT_DB_PATH = os.path.join("database", "topics.db")
 
+# When False, connections skip fsync and keep the rollback journal in memory.
+# Only the test suite turns this off; a crash could then corrupt the DB file.
+DURABLE_WRITES = True
+
 
 def ensure_db_dir(db_path: str = DEFAULT_DB_PATH) -> None:
+    if os.fspath(db_path).startswith("file:"):
+        # SQLite URI (e.g. shared in-memory DB); nothing to create on disk
+        return
     parent = os.path.dirname(db_path)
     if parent and not os.path.isdir(parent):
         os.makedirs(parent, exist_ok=True)
 
 
+@contextmanager
 def _connect(db_path: str):
     ensure_db_dir(db_path)
-    conn = sqlite3.connect(db_path)
-    conn.execute("PRAGMA foreign_keys = ON;")
-    return conn
+    conn = sqlite3.connect(db_path, uri=os.fspath(db_path).startswith("file:"))
+    try:
+        conn.execute("PRAGMA foreign_keys = ON;")
+        if not DURABLE_WRITES:
+            conn.execute("PRAGMA synchronous = OFF;")
+            conn.execute("PRAGMA journal_mode = MEMORY;")
+        yield conn
+    finally:
+        conn.close()
 
 
 def init_db(db_path: str = DEFAULT_DB_PATH) -> None:
@@ -75,12 +90,14 @@ def seed_potential_topics(
     """Seed potential_topics with (topic_name, field) rows using INSERT OR IGNORE.
 
     Returns the number of rows actually inserted (ignored duplicates excluded).
+    All rows go in as one executemany batch inside a single transaction.
     """
     with _connect(db_path) as conn:
         cur = conn.cursor()
+        cur.execute("BEGIN")
         cur.executemany(
             "INSERT OR IGNORE INTO potential_topics(topic_name, field) VALUES (?, ?);",
-            list(rows),
+            rows,
         )
         conn.commit()
         return cur.rowcount
@@ -110,6 +127,12 @@ DEFAULT_SEED_ROWS = [
     ("From prompts to protocols: MCP in production", DEFAULT_FIELD_GAI),
 ]
 
+# Seed topic names grouped by field, in DEFAULT_SEED_ROWS (i.e. id) order
+DEFAULT_ROWS_BY_FIELD: Dict[str, List[str]] = {}
+for _name, _field in DEFAULT_SEED_ROWS:
+    DEFAULT_ROWS_BY_FIELD.setdefault(_field, []).append(_name)
+del _name, _field
+
 
 def main() -> None:
     parser = argparse.ArgumentParser(
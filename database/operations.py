@@ -2,17 +2,20 @@ import os
 import sqlite3
 from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import List, Optional
+from itertools import repeat
+from typing import Iterable, List, Optional
 
 DEFAULT_DB_PATH = os.path.join("database", "topics.db")
 
 
 @contextmanager
 def get_connection(db_path: str = DEFAULT_DB_PATH):
+    # "file:" paths are SQLite URIs (e.g. shared in-memory DBs in tests)
+    is_uri = os.fspath(db_path).startswith("file:")
     parent = os.path.dirname(db_path)
-    if parent and not os.path.isdir(parent):
+    if not is_uri and parent and not os.path.isdir(parent):
         os.makedirs(parent, exist_ok=True)
-    conn = sqlite3.connect(db_path)
+    conn = sqlite3.connect(db_path, uri=is_uri)
     try:
         conn.execute("PRAGMA foreign_keys = ON;")
         yield conn
@@ -50,6 +53,30 @@ def record_posted_topic(
         conn.commit()
 
 
+def record_posted_topics(
+    topic_names: Iterable[str],
+    dates_posted: Optional[Iterable[Optional[str]]] = None,
+    db_path: str = DEFAULT_DB_PATH,
+) -> None:
+    """Insert several previous_topics rows in one executemany batch and commit.
+
+    ``dates_posted`` pairs up with ``topic_names``; missing entries (or all
+    of them, when omitted) default to the current ISO8601 UTC time.
+    """
+    now = _iso_now()
+    dates = repeat(None) if dates_posted is None else dates_posted
+    rows = [
+        (name, ts or now)
+        for name, ts in zip(topic_names, dates, strict=dates_posted is not None)
+    ]
+    with get_connection(db_path) as conn:
+        conn.executemany(
+            "INSERT INTO previous_topics(topic_name, date_posted) VALUES (?, ?);",
+            rows,
+        )
+        conn.commit()
+
+
 def select_new_topic(
     field: str, recent_limit: int = 10, db_path: str = DEFAULT_DB_PATH
 ) -> Optional[dict]:
@@ -25,6 +25,7 @@ Examples:
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import sys
 from pathlib import Path
@@ -218,6 +219,40 @@ def ensure_config(root: Path, non_interactive_field: Optional[str] = None) -> di
     return verified
 
 
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser once; parse_args reuses it (parsing keeps no state)."""
+    parser = argparse.ArgumentParser(
+        description="LinkedIn Post Automation Multi-Agent System"
+    )
+    parser.add_argument(
+        "--init-config",
+        action="store_true",
+        help="Initialize config.json and exit",
+    )
+    parser.add_argument(
+        "--field",
+        type=str,
+        help="Field value to set non-interactively (used with --init-config or default run)",
+    )
+    parser.add_argument(
+        "--run",
+        action="store_true",
+        help="Execute the full pipeline (default behavior if no flags provided)",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Execute setup and estimate costs without making LLM API calls",
+    )
+    parser.add_argument(
+        "--no-image",
+        action="store_true",
+        help="Skip image generation (reduces cost to $0.04-$0.10 text-only)",
+    )
+    return parser
+
+
 def parse_args(argv: list[str]) -> argparse.Namespace:
     """
     Parse command-line arguments for the multi-agent system.
@@ -247,35 +282,7 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
         >>> args.field
         "Data Science"
     """
-    parser = argparse.ArgumentParser(
-        description="LinkedIn Post Automation Multi-Agent System"
-    )
-    parser.add_argument(
-        "--init-config",
-        action="store_true",
-        help="Initialize config.json and exit",
-    )
-    parser.add_argument(
-        "--field",
-        type=str,
-        help="Field value to set non-interactively (used with --init-config or default run)",
-    )
-    parser.add_argument(
-        "--run",
-        action="store_true",
-        help="Execute the full pipeline (default behavior if no flags provided)",
-    )
-    parser.add_argument(
-        "--dry-run",
-        action="store_true",
-        help="Execute setup and estimate costs without making LLM API calls",
-    )
-    parser.add_argument(
-        "--no-image",
-        action="store_true",
-        help="Skip image generation (reduces cost to $0.04-$0.10 text-only)",
-    )
-    return parser.parse_args(argv)
+    return _build_parser().parse_args(argv)
 
 
 def print_summary(result: dict) -> None:
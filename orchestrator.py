@@ -64,6 +64,9 @@ class Orchestrator:
     TARGET_CHAR_COUNT = 2950
     MAX_CHAR_LOOP_ITERATIONS = 5
     MAX_TOPIC_PIVOTS = 2
+    # With config "self_critique": true the writer scores its own draft;
+    # at or above this score the reviewer's LLM pass is skipped
+    SELF_CRITIQUE_THRESHOLD = 0.7
 
     def __init__(self, config: dict, dry_run: bool = False, no_image: bool = False):
         """
@@ -350,6 +353,8 @@ class Orchestrator:
             writer_input = {
                 "structured_prompt": structured_prompt,
             }
+            if self.config.get("self_critique"):
+                writer_input["self_critique"] = True
 
             if shortening_instruction:
                 writer_input["shortening_instruction"] = shortening_instruction
@@ -367,6 +372,9 @@ class Orchestrator:
 
             # Execute Reviewer Agent
             reviewer_input = {"draft_text": draft_text}
+            score = writer_response["data"].get("self_critique_score")
+            if score is not None and score >= self.SELF_CRITIQUE_THRESHOLD:
+                reviewer_input["skip_llm_review"] = True
 
             reviewer_response = self._execute_agent_with_retry(
                 "reviewer_agent", reviewer_agent.run, reviewer_input
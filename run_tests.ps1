@@ -10,6 +10,7 @@
 #   .\run_tests.ps1 -Unit              # Run only unit tests
 #   .\run_tests.ps1 -Integration       # Run only integration tests
 #   .\run_tests.ps1 -Verbose           # Run with verbose output
+#   .\run_tests.ps1 -Parallel          # Run in parallel with pytest-xdist
 #   .\run_tests.ps1 -File <path>       # Run specific test file
 
 param(
@@ -19,6 +20,7 @@ param(
     [switch]$Integration,
     [switch]$Persona,
     [switch]$Verbose,
+    [switch]$Parallel,
     [switch]$Help,
     [string]$File = ""
 )
@@ -38,6 +40,7 @@ Options:
     -Integration    Run only integration tests (marker: integration)
     -Persona        Run only persona compliance tests (marker: persona)
     -Verbose        Enable verbose output
+    -Parallel       Run across all CPU cores (pytest-xdist, one worker per file)
     -File <path>    Run a specific test file
     -Help           Show this help message
 
@@ -46,6 +49,7 @@ Examples:
     .\run_tests.ps1 -Coverage               # Run with coverage
     .\run_tests.ps1 -CoverageHtml           # Generate HTML report
     .\run_tests.ps1 -Unit -Verbose          # Run unit tests with verbose output
+    .\run_tests.ps1 -Parallel               # Run all tests in parallel
     .\run_tests.ps1 -File tests/test_error_handling.py
 
 "@
@@ -69,6 +73,13 @@ if ($Verbose) {
     $pytestArgs += "-v"
 }
 
+# Add parallel execution (loadfile keeps module-scoped fixtures on one worker)
+if ($Parallel) {
+    $pytestArgs += "-n"
+    $pytestArgs += "auto"
+    $pytestArgs += "--dist=loadfile"
+}
+
 # Add marker filters
 if ($Unit) {
     $pytestArgs += "-m"
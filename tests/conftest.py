@@ -0,0 +1,103 @@
+"""Suite-wide fixtures.
+
+Database tests get a private shared-cache in-memory copy (via the SQLite
+backup API) of a session template, so the test body never touches the disk.
+"""
+
+import shutil
+import sqlite3
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+import core.persistence
+import core.retry
+import database.init_db
+from core.dry_run import reset_dry_run
+from database.init_db import init_db, seed_potential_topics, DEFAULT_SEED_ROWS
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _non_durable_writes():
+    """Skip fsync in artifact writes and SQLite commits.
+
+    Rename atomicity is still exercised. Tests that check fsync behavior pass
+    ``durable=True`` explicitly.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(core.persistence, "DURABLE_WRITES", False)
+        mp.setattr(database.init_db, "DURABLE_WRITES", False)
+        yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _no_backoff_sleep():
+    """Make retry backoff instant.
+
+    Only core.retry's ``time`` binding is swapped; the real ``time.sleep``
+    stays intact for the threaded persistence tests.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(core.retry, "time", SimpleNamespace(sleep=lambda _delay: None))
+        yield
+
+
+@pytest.fixture(autouse=True)
+def _isolate_dry_run():
+    """Start and end every test with the process-wide dry-run flag off."""
+    reset_dry_run()
+    yield
+    reset_dry_run()
+
+
+@pytest.fixture(scope="session")
+def schema_template_db(tmp_path_factory):
+    """Session template DB file with the schema and no rows."""
+    db_path = tmp_path_factory.mktemp("db_templates") / "schema.db"
+    init_db(str(db_path))
+    return db_path
+
+
+@pytest.fixture(scope="session")
+def seeded_template_db(schema_template_db):
+    """Session template DB file with the schema plus DEFAULT_SEED_ROWS."""
+    db_path = schema_template_db.with_name("seeded.db")
+    shutil.copyfile(schema_template_db, db_path)
+    seed_potential_topics(DEFAULT_SEED_ROWS, str(db_path))
+    return db_path
+
+
+def _memory_copy(template_path):
+    """Copy ``template_path`` into a new shared in-memory DB.
+
+    Returns ``(uri, keeper)``. The DB lives only while a connection to it
+    is open, so the caller must hold ``keeper`` until the test finishes.
+    """
+    db_uri = f"file:test_db_{uuid.uuid4().hex}?mode=memory&cache=shared"
+    keeper = sqlite3.connect(db_uri, uri=True)
+    template = sqlite3.connect(template_path)
+    try:
+        template.backup(keeper)
+    finally:
+        template.close()
+    return db_uri, keeper
+
+
+@pytest.fixture
+def empty_db(schema_template_db):
+    """Per-test in-memory copy of the schema-only database (a "file:" URI)."""
+    db_uri, keeper = _memory_copy(schema_template_db)
+    yield db_uri
+    keeper.close()
+
+
+@pytest.fixture
+def fresh_db(seeded_template_db):
+    """Per-test in-memory copy of the seeded database (a "file:" URI).
+
+    Modules can override ``seeded_template_db`` to seed their own rows.
+    """
+    db_uri, keeper = _memory_copy(seeded_template_db)
+    yield db_uri
+    keeper.close()
@@ -0,0 +1,17 @@
+"""Shared assertion helpers for agent tests."""
+
+
+def assert_validation_error(response, *, retryable=False, contains=None):
+    """Assert ``response`` is a ValidationError envelope from ``err()``.
+
+    Checks the error-envelope keys directly, so callers need not also run
+    ``validate_envelope``. ``contains`` is matched against the lowercased
+    error message.
+    """
+    assert response["status"] == "error"
+    assert response["data"] == {}
+    error = response["error"]
+    assert error["type"] == "ValidationError"
+    assert error["retryable"] is retryable
+    if contains is not None:
+        assert contains in error["message"].lower()
@@ -0,0 +1,23 @@
+"""Shared fixtures for agent tests."""
+
+# flake8: noqa: E501
+
+from types import MappingProxyType
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def sample_research():
+    """Read-only research payload shared by every agent test in the session."""
+    return MappingProxyType(
+        {
+            "topic": "Redis optimization",
+            "sources": (
+                MappingProxyType(
+                    {"title": "Redis best practices", "url": "https://example.com/1"}
+                ),
+            ),
+            "summary": "Key strategies for optimizing Redis performance including connection pooling and data structure selection.",
+        }
+    )
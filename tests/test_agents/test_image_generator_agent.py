@@ -1,6 +1,5 @@
 """Tests for image_generator_agent.py (Phase 7.8 - Real Gemini image generation)."""
 
-import tempfile
 from pathlib import Path
 import pytest
 from unittest.mock import patch, MagicMock
@@ -10,19 +9,16 @@ from core.envelope import validate_envelope
 
 
 @pytest.fixture
-def temp_run_dir():
+def temp_run_dir(tmp_path):
     """Create a temporary run directory with image prompt file."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        run_path = Path(tmpdir)
-
-        # Create a sample image prompt file
-        prompt_path = run_path / "70_image_prompt.txt"
-        prompt_path.write_text(
-            "A futuristic data center with flowing streams of light, "
-            "cool blue tones, modern aesthetic. Zero text in image."
-        )
+    # Create a sample image prompt file
+    prompt_path = tmp_path / "70_image_prompt.txt"
+    prompt_path.write_text(
+        "A futuristic data center with flowing streams of light, "
+        "cool blue tones, modern aesthetic. Zero text in image."
+    )
 
-        yield run_path
+    return tmp_path
 
 
 @pytest.fixture
@@ -263,20 +259,19 @@ def test_image_generator_agent_cost_tracking_integration(
     assert call_kwargs["model"] == "gemini-2.5-flash-image"
 
 
-def test_write_placeholder_png():
+def test_write_placeholder_png(tmp_path):
     """Test that placeholder PNG is valid."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        png_path = Path(tmpdir) / "placeholder.png"
+    png_path = tmp_path / "placeholder.png"
 
-        _write_placeholder_png(png_path)
+    _write_placeholder_png(png_path)
 
-        assert png_path.exists()
-        assert png_path.stat().st_size > 0
+    assert png_path.exists()
+    assert png_path.stat().st_size > 0
 
-        # Verify PNG signature
-        with open(png_path, "rb") as f:
-            signature = f.read(4)
-        assert signature == b"\x89PNG"
+    # Verify PNG signature
+    with open(png_path, "rb") as f:
+        signature = f.read(4)
+    assert signature == b"\x89PNG"
 
 
 @patch("agents.image_generator_agent.get_image_client")
@@ -1,6 +1,5 @@
 """Tests for image_prompt_agent.py (Phase 7.7 - LLM-powered Visual Strategist)."""
 
-import tempfile
 from pathlib import Path
 import pytest
 from unittest.mock import patch, MagicMock
@@ -10,14 +9,6 @@ from core.envelope import validate_envelope
 from core.fallback_tracker import FallbackTracker
 
 
-@pytest.fixture
-def temp_run_dir():
-    """Create a temporary run directory."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        run_path = Path(tmpdir)
-        yield run_path
-
-
 @pytest.fixture
 def sample_final_post():
     """Sample final post for testing."""
@@ -61,21 +52,19 @@ def mock_cost_tracker():
 
 
 @pytest.fixture
-def mock_fallback_tracker():
+def mock_fallback_tracker(tmp_path):
     """Mock fallback tracker."""
-    # Use a temporary directory for the run_path
-    with tempfile.TemporaryDirectory() as tmpdir:
-        mock_tracker = FallbackTracker(Path(tmpdir))
-        mock_tracker.record_warning = MagicMock()
-        # Mock user approval to always be true to avoid interactive prompts
-        mock_tracker.request_user_approval = MagicMock(return_value=True)
-        yield mock_tracker
+    mock_tracker = FallbackTracker(tmp_path)
+    mock_tracker.record_warning = MagicMock()
+    # Mock user approval to always be true to avoid interactive prompts
+    mock_tracker.request_user_approval = MagicMock(return_value=True)
+    return mock_tracker
 
 
 @patch("agents.image_prompt_agent.get_text_client")
 def test_image_prompt_agent_success(
     mock_get_client,
-    temp_run_dir,
+    tmp_path,
     sample_final_post,
     sample_valid_prompt,
     mock_cost_tracker,
@@ -93,7 +82,7 @@ def test_image_prompt_agent_success(
     input_obj = {"final_post": sample_final_post}
     context = {
         "run_id": "test-run-001",
-        "run_path": temp_run_dir,
+        "run_path": tmp_path,
         "cost_tracker": mock_cost_tracker,
     }
 
@@ -106,7 +95,7 @@ def test_image_prompt_agent_success(
     assert "prompt_preview" in response["data"]
 
     # Verify artifact persistence
-    artifact_path = temp_run_dir / "70_image_prompt.txt"
+    artifact_path = tmp_path / "70_image_prompt.txt"
     assert artifact_path.exists()
 
     prompt_text = artifact_path.read_text()
@@ -124,10 +113,10 @@ def test_image_prompt_agent_success(
     assert sample_final_post in call_kwargs["prompt"]
 
 
-def test_image_prompt_agent_missing_final_post(temp_run_dir):
+def test_image_prompt_agent_missing_final_post(tmp_path):
     """Test error handling when final_post is missing."""
     input_obj = {}
-    context = {"run_id": "test-run-002", "run_path": temp_run_dir}
+    context = {"run_id": "test-run-002", "run_path": tmp_path}
 
     response = run(input_obj, context)
 
@@ -137,12 +126,12 @@ def test_image_prompt_agent_missing_final_post(temp_run_dir):
     assert response["error"]["retryable"] is False
 
 
-def test_image_prompt_agent_empty_final_post(temp_run_dir, mock_fallback_tracker):
+def test_image_prompt_agent_empty_final_post(tmp_path, mock_fallback_tracker):
     """Test error handling when final_post is empty."""
     input_obj = {"final_post": "   "}
     context = {
         "run_id": "test-run-003",
-        "run_path": temp_run_dir,
+        "run_path": tmp_path,
         "fallback_tracker": mock_fallback_tracker,
     }
 
@@ -157,7 +146,7 @@ def test_image_prompt_agent_empty_final_post(temp_run_dir, mock_fallback_tracker
 @patch("agents.image_prompt_agent.get_text_client")
 def test_image_prompt_agent_validates_no_text_constraint(
     mock_get_client,
-    temp_run_dir,
+    tmp_path,
     sample_final_post,
     sample_invalid_prompt,
     mock_cost_tracker,
@@ -176,7 +165,7 @@ def test_image_prompt_agent_validates_no_text_constraint(
     input_obj = {"final_post": sample_final_post}
     context = {
         "run_id": "test-run-004",
-        "run_path": temp_run_dir,
+        "run_path": tmp_path,
         "cost_tracker": mock_cost_tracker,
         "fallback_tracker": mock_fallback_tracker,
     }
@@ -193,7 +182,7 @@ def test_image_prompt_agent_validates_no_text_constraint(
 @patch("agents.image_prompt_agent.get_text_client")
 def test_image_prompt_agent_llm_failure(
     mock_get_client,
-    temp_run_dir,
+    tmp_path,
     sample_final_post,
     mock_cost_tracker,
     mock_fallback_tracker,
@@ -207,7 +196,7 @@ def test_image_prompt_agent_llm_failure(
     input_obj = {"final_post": sample_final_post}
     context = {
         "run_id": "test-run-005",
-        "run_path": temp_run_dir,
+        "run_path": tmp_path,
         "cost_tracker": mock_cost_tracker,
         "fallback_tracker": mock_fallback_tracker,
     }
@@ -248,7 +237,7 @@ def test_validate_no_text_constraint_rejects_invalid():
 @patch("agents.image_prompt_agent.get_text_client")
 def test_image_prompt_agent_prompt_preview(
     mock_get_client,
-    temp_run_dir,
+    tmp_path,
     sample_final_post,
     sample_valid_prompt,
     mock_cost_tracker,
@@ -268,7 +257,7 @@ def test_image_prompt_agent_prompt_preview(
     input_obj = {"final_post": sample_final_post}
     context = {
         "run_id": "test-run-006",
-        "run_path": temp_run_dir,
+        "run_path": tmp_path,
         "cost_tracker": mock_cost_tracker,
     }
 
@@ -285,7 +274,7 @@ def test_image_prompt_agent_prompt_preview(
 
 @patch("agents.image_prompt_agent.get_text_client")
 def test_image_prompt_agent_includes_visual_elements(
-    mock_get_client, temp_run_dir, sample_final_post, mock_cost_tracker
+    mock_get_client, tmp_path, sample_final_post, mock_cost_tracker
 ):
     """Test that generated prompt includes visual elements."""
     # Mock a realistic prompt
@@ -306,7 +295,7 @@ The image must contain zero text, words, or letters."""
     input_obj = {"final_post": sample_final_post}
     context = {
         "run_id": "test-run-007",
-        "run_path": temp_run_dir,
+        "run_path": tmp_path,
         "cost_tracker": mock_cost_tracker,
     }
 
@@ -314,7 +303,7 @@ The image must contain zero text, words, or letters."""
 
     assert response["status"] == "ok"
 
-    artifact_path = temp_run_dir / "70_image_prompt.txt"
+    artifact_path = tmp_path / "70_image_prompt.txt"
     prompt_text = artifact_path.read_text().lower()
 
     # Should include visual style elements
@@ -332,7 +321,7 @@ The image must contain zero text, words, or letters."""
 @patch("agents.image_prompt_agent.get_text_client")
 def test_image_prompt_agent_cost_tracking_integration(
     mock_get_client,
-    temp_run_dir,
+    tmp_path,
     sample_final_post,
     sample_valid_prompt,
     mock_cost_tracker,
@@ -349,7 +338,7 @@ def test_image_prompt_agent_cost_tracking_integration(
     input_obj = {"final_post": sample_final_post}
     context = {
         "run_id": "test-run-008",
-        "run_path": temp_run_dir,
+        "run_path": tmp_path,
         "cost_tracker": mock_cost_tracker,
     }
 
@@ -5,41 +5,58 @@ Contains long mock response strings for test fixtures.
 
 # flake8: noqa: E501
 
-import tempfile
-from pathlib import Path
-import pytest
-import json
-from unittest.mock import patch
+from dataclasses import dataclass, field
 
-from agents.prompt_generator_agent import run, _validate_prompt_structure
+import pytest
+import orjson
+from hypothesis import given, settings, strategies as st
+
+from agents.prompt_generator_agent import (
+    CLICHE_PHRASES,
+    run,
+    _validate_prompt_structure,
+)
 from core.envelope import validate_envelope
-from core.errors import ValidationError
+from core.errors import ModelError, ValidationError
 
 
-@pytest.fixture
-def temp_run_dir():
-    """Create a temporary run directory."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        run_path = Path(tmpdir)
-        yield run_path
+@dataclass
+class _StubClient:
+    """Minimal text client: replays canned responses or raises ``error``."""
 
+    responses: tuple = ()
+    error: Exception | None = None
+    calls: list = field(default_factory=list)
 
-@pytest.fixture
-def sample_research():
-    """Sample research data for testing."""
-    return {
-        "topic": "Redis optimization",
-        "sources": [{"title": "Redis best practices", "url": "https://example.com/1"}],
-        "summary": "Key strategies for optimizing Redis performance including connection pooling and data structure selection.",
-    }
+    def generate_text(self, **kwargs):
+        self.calls.append(kwargs)
+        if self.error is not None:
+            raise self.error
+        return self.responses[len(self.calls) - 1]
 
 
-def test_prompt_generator_success(temp_run_dir, sample_research):
-    """Test successful prompt generation with mocked LLM."""
-    input_obj = {"topic": "Redis optimization", "research": sample_research}
-    context = {"run_id": "test-run-001", "run_path": temp_run_dir}
+@pytest.fixture(autouse=True)
+def text_client(monkeypatch):
+    """Route get_text_client to a _StubClient for every test.
+
+    Call the fixture with canned responses (or ``error=``) to install a
+    fresh stub; the returned stub records each ``generate_text`` call.
+    """
+
+    def install(*responses, error=None):
+        stub = _StubClient(responses=responses, error=error)
+        monkeypatch.setattr(
+            "agents.prompt_generator_agent.get_text_client", lambda: stub
+        )
+        return stub
 
-    # Mock LLM response with valid structured prompt
+    install()
+    return install
+
+
+@pytest.fixture
+def mock_redis_prompt_response():
+    """LLM response dict carrying a valid structured prompt."""
     mock_prompt = """Generate a LinkedIn post using the Witty Expert persona.
 
 **Topic:** Redis Optimization: The Art of Speed Without Compromise
@@ -62,53 +79,69 @@ pool = redis.ConnectionPool(host='localhost', port=6379, max_connections=50)
 r = redis.Redis(connection_pool=pool)
 ```
 """
-
-    mock_llm_response = {
+    return {
         "text": mock_prompt,
         "token_usage": {"prompt_tokens": 200, "completion_tokens": 400},
         "model": "gemini-2.5-pro",
     }
 
-    with patch("agents.prompt_generator_agent.get_text_client") as mock_client:
-        mock_client.return_value.generate_text.return_value = mock_llm_response
 
-        response = run(input_obj, context)
+@pytest.fixture
+def mock_cliche_prompt_response():
+    """LLM response dict whose prompt contains a clichéd analogy."""
+    mock_prompt_with_cliche = """Generate a LinkedIn post using the Witty Expert persona.
+
+**Topic:** Blockchain Consensus
+
+**Target Audience:** Distributed Systems Engineers
+
+**Audience's Core Pain Point:** Understanding consensus mechanisms
 
-        # Validate envelope structure
-        validate_envelope(response)
-        assert response["status"] == "ok"
+**Key Metrics/Facts:** Blockchain is like a distributed ledger that everyone can see.
 
-        # Verify structured prompt is present
-        assert "structured_prompt" in response["data"]
-        assert "**Topic:**" in response["data"]["structured_prompt"]
-        assert "**Target Audience:**" in response["data"]["structured_prompt"]
+**The Simple Solution/Code Snippet:** Use proof of stake."""
 
-        # Verify artifact persistence
-        artifact_path = temp_run_dir / "25_structured_prompt.json"
-        assert artifact_path.exists()
+    return {
+        "text": mock_prompt_with_cliche,
+        "token_usage": {"prompt_tokens": 100, "completion_tokens": 200},
+        "model": "gemini-2.5-pro",
+    }
 
-        with open(artifact_path) as f:
-            artifact_data = json.load(f)
-        assert "structured_prompt" in artifact_data
 
+def test_prompt_generator_success(
+    tmp_path, sample_research, mock_redis_prompt_response, text_client
+):
+    """Test successful prompt generation with mocked LLM."""
+    input_obj = {"topic": "Redis optimization", "research": sample_research}
+    context = {"run_id": "test-run-001", "run_path": tmp_path}
 
-def test_prompt_generator_missing_topic(temp_run_dir, sample_research):
-    """Test error handling when topic is missing."""
-    input_obj = {"research": sample_research}
-    context = {"run_id": "test-run-002", "run_path": temp_run_dir}
+    text_client(mock_redis_prompt_response)
 
     response = run(input_obj, context)
 
+    # Validate envelope structure
     validate_envelope(response)
-    assert response["status"] == "error"
-    assert response["error"]["type"] == "ValidationError"
-    assert response["error"]["retryable"] is False
+    assert response["status"] == "ok"
 
+    # Verify structured prompt is present
+    assert "structured_prompt" in response["data"]
+    assert "**Topic:**" in response["data"]["structured_prompt"]
+    assert "**Target Audience:**" in response["data"]["structured_prompt"]
 
-def test_prompt_generator_missing_research(temp_run_dir):
-    """Test error handling when research is missing."""
-    input_obj = {"topic": "Redis optimization"}
-    context = {"run_id": "test-run-003", "run_path": temp_run_dir}
+    # Verify artifact persistence
+    artifact_path = tmp_path / "25_structured_prompt.json"
+    assert artifact_path.exists()
+
+    artifact_data = orjson.loads(artifact_path.read_bytes())
+    assert "structured_prompt" in artifact_data
+
+
+@pytest.mark.parametrize("missing_field", ["topic", "research"])
+def test_prompt_generator_missing_input(tmp_path, sample_research, missing_field):
+    """Test error handling when topic or research is missing."""
+    input_obj = {"topic": "Redis optimization", "research": sample_research}
+    del input_obj[missing_field]
+    context = {"run_id": "test-run-002", "run_path": tmp_path}
 
     response = run(input_obj, context)
 
@@ -118,46 +151,30 @@ def test_prompt_generator_missing_research(temp_run_dir):
     assert response["error"]["retryable"] is False
 
 
-def test_prompt_generator_rejects_cliche_analogies(temp_run_dir, sample_research):
+def test_prompt_generator_rejects_cliche_analogies(
+    tmp_path, sample_research, mock_cliche_prompt_response, text_client
+):
     """Test that validation rejects prompts with clichéd analogies."""
     input_obj = {"topic": "Blockchain consensus", "research": sample_research}
-    context = {"run_id": "test-run-004", "run_path": temp_run_dir}
+    context = {"run_id": "test-run-004", "run_path": tmp_path}
 
-    # Mock LLM response with cliché
-    mock_prompt_with_cliche = """Generate a LinkedIn post using the Witty Expert persona.
+    text_client(mock_cliche_prompt_response)
 
-**Topic:** Blockchain Consensus
-
-**Target Audience:** Distributed Systems Engineers
-
-**Audience's Core Pain Point:** Understanding consensus mechanisms
-
-**Key Metrics/Facts:** Blockchain is like a distributed ledger that everyone can see.
-
-**The Simple Solution/Code Snippet:** Use proof of stake."""
-
-    mock_llm_response = {
-        "text": mock_prompt_with_cliche,
-        "token_usage": {"prompt_tokens": 100, "completion_tokens": 200},
-        "model": "gemini-2.5-pro",
-    }
-
-    with patch("agents.prompt_generator_agent.get_text_client") as mock_client:
-        mock_client.return_value.generate_text.return_value = mock_llm_response
-
-        response = run(input_obj, context)
+    response = run(input_obj, context)
 
-        # Should reject due to cliché
-        assert response["status"] == "error"
-        assert response["error"]["type"] == "ValidationError"
-        assert "cliché" in response["error"]["message"].lower()
+    # Should reject due to cliché
+    assert response["status"] == "error"
+    assert response["error"]["type"] == "ValidationError"
+    assert response["error"]["code"] == "CLICHE_DETECTED"
 
 
-def test_prompt_generator_repairs_missing_sections(temp_run_dir, sample_research):
+def test_prompt_generator_repairs_missing_sections(
+    tmp_path, sample_research, text_client
+):
     """Ensure agent self-repairs when LLM omits required sections."""
 
     input_obj = {"topic": "Prompt reliability", "research": sample_research}
-    context = {"run_id": "test-run-006", "run_path": temp_run_dir}
+    context = {"run_id": "test-run-006", "run_path": tmp_path}
 
     missing_sections = """Generate a LinkedIn post using the Witty Expert persona.
 
@@ -181,32 +198,31 @@ def test_prompt_generator_repairs_missing_sections(temp_run_dir, sample_research
 **The Simple Solution/Code Snippet:** Enforce templates with post-processing.
 """
 
-    mock_llm_responses = [
+    stub = text_client(
         {
             "text": missing_sections,
             "token_usage": {"prompt_tokens": 50, "completion_tokens": 100},
+            "model": "gemini-2.5-pro",
         },
         {
             "text": repaired_prompt,
             "token_usage": {"prompt_tokens": 60, "completion_tokens": 120},
+            "model": "gemini-2.5-pro",
         },
-    ]
-
-    with patch("agents.prompt_generator_agent.get_text_client") as mock_client:
-        mock_client.return_value.generate_text.side_effect = mock_llm_responses
+    )
 
-        response = run(input_obj, context)
+    response = run(input_obj, context)
 
-        validate_envelope(response)
-        assert response["status"] == "ok"
-        structured = response["data"]["structured_prompt"]
-        assert "**Key Metrics/Facts:**" in structured
-        assert "**The Simple Solution/Code Snippet:**" in structured
-        # Should have required both calls (initial + repair)
-        assert mock_client.return_value.generate_text.call_count == 2
+    validate_envelope(response)
+    assert response["status"] == "ok"
+    structured = response["data"]["structured_prompt"]
+    assert "**Key Metrics/Facts:**" in structured
+    assert "**The Simple Solution/Code Snippet:**" in structured
+    # Should have required both calls (initial + repair)
+    assert len(stub.calls) == 2
 
 
-def test_prompt_generator_validates_required_sections(temp_run_dir, sample_research):
+def test_prompt_generator_validates_required_sections(tmp_path, sample_research):
     """Test that validation checks for all required sections."""
     # Test validation function directly
     valid_prompt = """**Topic:** Test
@@ -226,21 +242,66 @@ def test_prompt_generator_validates_required_sections(temp_run_dir, sample_resea
         _validate_prompt_structure(invalid_prompt)
 
 
-def test_prompt_generator_llm_failure(temp_run_dir, sample_research):
+def test_validate_prompt_structure_reports_cliches_case_insensitively():
+    """Test cliché detection ignores case and lists each phrase once."""
+    prompt = """**Topic:** Test
+**Target Audience:** Engineers
+**Audience's Core Pain Point:** Only the Tip of the Iceberg
+**Key Metrics/Facts:** Like A Recipe, like a recipe, tip of the iceberg
+**The Simple Solution/Code Snippet:** Code here"""
+
+    with pytest.raises(ValidationError) as exc_info:
+        _validate_prompt_structure(prompt)
+
+    assert "['like a recipe', 'tip of the iceberg']" in str(exc_info.value)
+
+
+# Filler text that can never spell out a cliché on its own
+_FILLER = st.text(alphabet="0123456789 .,;:-", max_size=40)
+
+
+def _prompt_with_metrics(metrics: str) -> str:
+    return f"""**Topic:** Test
+**Target Audience:** Engineers
+**Audience's Core Pain Point:** Problems
+**Key Metrics/Facts:** {metrics}
+**The Simple Solution/Code Snippet:** Code here"""
+
+
+@settings(max_examples=200, deadline=50)
+@given(
+    cliche=st.sampled_from(CLICHE_PHRASES),
+    casing=st.sampled_from([str.lower, str.upper, str.title]),
+    prefix=_FILLER,
+    suffix=_FILLER,
+)
+def test_validate_prompt_structure_rejects_any_cliche(cliche, casing, prefix, suffix):
+    """Property: a cliché spliced anywhere, in any casing, is rejected."""
+    prompt = _prompt_with_metrics(f"{prefix}{casing(cliche)}{suffix}")
+
+    with pytest.raises(ValidationError) as exc_info:
+        _validate_prompt_structure(prompt)
+
+    assert repr(cliche) in str(exc_info.value)
+
+
+@settings(max_examples=200, deadline=50)
+@given(metrics=_FILLER)
+def test_validate_prompt_structure_accepts_cliche_free_prompts(metrics):
+    """Property: complete prompts without clichés always validate."""
+    _validate_prompt_structure(_prompt_with_metrics(metrics))
+
+
+def test_prompt_generator_llm_failure(tmp_path, sample_research, text_client):
     """Test handling of LLM failure."""
     input_obj = {"topic": "Test topic", "research": sample_research}
-    context = {"run_id": "test-run-005", "run_path": temp_run_dir}
+    context = {"run_id": "test-run-005", "run_path": tmp_path}
 
-    from core.errors import ModelError
+    text_client(error=ModelError("LLM unavailable"))
 
-    with patch("agents.prompt_generator_agent.get_text_client") as mock_client:
-        mock_client.return_value.generate_text.side_effect = ModelError(
-            "LLM unavailable"
-        )
-
-        response = run(input_obj, context)
+    response = run(input_obj, context)
 
-        validate_envelope(response)
-        assert response["status"] == "error"
-        assert response["error"]["type"] == "ModelError"
-        assert response["error"]["retryable"] is True
+    validate_envelope(response)
+    assert response["status"] == "error"
+    assert response["error"]["type"] == "ModelError"
+    assert response["error"]["retryable"] is True
@@ -5,10 +5,10 @@ Contains long mock response strings for test fixtures.
 
 # flake8: noqa: E501
 
-import tempfile
-from pathlib import Path
+from types import MappingProxyType
+
 import pytest
-import json
+import orjson
 from unittest.mock import patch, MagicMock
 
 from agents.research_agent import run
@@ -18,29 +18,17 @@ from core.fallback_tracker import FallbackTracker
 
 
 @pytest.fixture
-def temp_run_dir():
-    """Create a temporary run directory."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        run_path = Path(tmpdir)
-        yield run_path
-
-
-@pytest.fixture
-def mock_fallback_tracker():
+def mock_fallback_tracker(tmp_path):
     """Mock fallback tracker."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        mock_tracker = FallbackTracker(Path(tmpdir))
-        mock_tracker.record_warning = MagicMock()
-        mock_tracker.request_user_approval = MagicMock(return_value=True)
-        yield mock_tracker
+    mock_tracker = FallbackTracker(tmp_path)
+    mock_tracker.record_warning = MagicMock()
+    mock_tracker.request_user_approval = MagicMock(return_value=True)
+    return mock_tracker
 
 
-def test_research_agent_success(temp_run_dir):
-    """Test successful research execution with mocked LLM."""
-    input_obj = {"topic": "Python asyncio optimization"}
-    context = {"run_id": "test-run-001", "run_path": temp_run_dir}
-
-    # Mock LLM response
+@pytest.fixture(scope="module")
+def mock_research_response():
+    """Read-only LLM response with two well-formed research sources."""
     mock_research = {
         "sources": [
             {
@@ -56,14 +44,35 @@ def test_research_agent_success(temp_run_dir):
         ],
         "summary": "Python asyncio optimization focuses on event loop efficiency and task scheduling.",
     }
-    mock_llm_response = {
-        "text": json.dumps(mock_research),
-        "token_usage": {"prompt_tokens": 100, "completion_tokens": 200},
-        "model": "gemini-2.5-pro",
-    }
+    return MappingProxyType(
+        {
+            "text": orjson.dumps(mock_research).decode(),
+            "token_usage": {"prompt_tokens": 100, "completion_tokens": 200},
+            "model": "gemini-2.5-pro",
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def mock_empty_research_response():
+    """Read-only LLM response with no sources (triggers memory bank fallback)."""
+    mock_research = {"sources": [], "summary": "No sources available"}
+    return MappingProxyType(
+        {
+            "text": orjson.dumps(mock_research).decode(),
+            "token_usage": {"prompt_tokens": 100, "completion_tokens": 50},
+            "model": "gemini-2.5-pro",
+        }
+    )
+
+
+def test_research_agent_success(tmp_path, mock_research_response):
+    """Test successful research execution with mocked LLM."""
+    input_obj = {"topic": "Python asyncio optimization"}
+    context = {"run_id": "test-run-001", "run_path": tmp_path}
 
     with patch("agents.research_agent.get_text_client") as mock_client:
-        mock_client.return_value.generate_text.return_value = mock_llm_response
+        mock_client.return_value.generate_text.return_value = mock_research_response
 
         response = run(input_obj, context)
 
@@ -76,33 +85,45 @@ def test_research_agent_success(temp_run_dir):
         assert len(response["data"]["sources"]) == 2
 
         # Verify artifact persistence
-        artifact_path = temp_run_dir / "20_research.json"
+        artifact_path = tmp_path / "20_research.json"
         assert artifact_path.exists()
 
-        with open(artifact_path) as f:
-            artifact_data = json.load(f)
+        artifact_data = orjson.loads(artifact_path.read_bytes())
         assert artifact_data["topic"] == "Python asyncio optimization"
         assert len(artifact_data["sources"]) == 2
 
 
-def test_research_agent_missing_topic(temp_run_dir):
-    """Test error handling when topic is missing."""
-    input_obj = {}
-    context = {"run_id": "test-run-002", "run_path": temp_run_dir}
+@pytest.mark.parametrize(
+    "input_obj, llm_error, error_type, retryable",
+    [
+        ({}, None, "ValidationError", False),
+        ({"topic": "Test topic"}, ModelError("LLM unavailable"), "ModelError", True),
+    ],
+    ids=["missing_topic", "llm_failure"],
+)
+def test_research_agent_error_paths(
+    tmp_path, input_obj, llm_error, error_type, retryable
+):
+    """Test error envelopes for missing input and LLM failure."""
+    context = {"run_id": "test-run-002", "run_path": tmp_path}
 
-    response = run(input_obj, context)
+    with patch("agents.research_agent.get_text_client") as mock_client:
+        mock_client.return_value.generate_text.side_effect = llm_error
+
+        response = run(input_obj, context)
 
     validate_envelope(response)
     assert response["status"] == "error"
-    assert response["error"]["type"] == "ValidationError"
-    assert "topic" in response["error"]["message"].lower()
-    assert response["error"]["retryable"] is False
+    assert response["error"]["type"] == error_type
+    assert response["error"]["retryable"] is retryable
+    if error_type == "ValidationError":
+        assert "topic" in response["error"]["message"].lower()
 
 
-def test_research_agent_sources_structure(temp_run_dir):
+def test_research_agent_sources_structure(tmp_path):
     """Test that sources have expected structure."""
     input_obj = {"topic": "Machine learning pipelines"}
-    context = {"run_id": "test-run-003", "run_path": temp_run_dir}
+    context = {"run_id": "test-run-003", "run_path": tmp_path}
 
     # Mock LLM response
     mock_research = {
@@ -116,7 +137,7 @@ def test_research_agent_sources_structure(temp_run_dir):
         "summary": "Machine learning pipelines require careful orchestration.",
     }
     mock_llm_response = {
-        "text": json.dumps(mock_research),
+        "text": orjson.dumps(mock_research).decode(),
         "token_usage": {"prompt_tokens": 100, "completion_tokens": 150},
         "model": "gemini-2.5-pro",
     }
@@ -137,11 +158,11 @@ def test_research_agent_sources_structure(temp_run_dir):
             assert isinstance(source["url"], str)
 
 
-def test_research_agent_summary_contains_topic(temp_run_dir):
+def test_research_agent_summary_contains_topic(tmp_path):
     """Test that summary references the topic."""
     topic = "Time-series forecasting"
     input_obj = {"topic": topic}
-    context = {"run_id": "test-run-004", "run_path": temp_run_dir}
+    context = {"run_id": "test-run-004", "run_path": tmp_path}
 
     # Mock LLM response
     mock_research = {
@@ -155,7 +176,7 @@ def test_research_agent_summary_contains_topic(temp_run_dir):
         "summary": f"Research on {topic} shows multiple approaches for prediction accuracy.",
     }
     mock_llm_response = {
-        "text": json.dumps(mock_research),
+        "text": orjson.dumps(mock_research).decode(),
         "token_usage": {"prompt_tokens": 100, "completion_tokens": 150},
         "model": "gemini-2.5-pro",
     }
@@ -170,43 +191,21 @@ def test_research_agent_summary_contains_topic(temp_run_dir):
         assert topic in summary
 
 
-def test_research_agent_llm_failure(temp_run_dir):
-    """Test handling of LLM failure."""
-    input_obj = {"topic": "Test topic"}
-    context = {"run_id": "test-run-005", "run_path": temp_run_dir}
-
-    with patch("agents.research_agent.get_text_client") as mock_client:
-        mock_client.return_value.generate_text.side_effect = ModelError(
-            "LLM unavailable"
-        )
-
-        response = run(input_obj, context)
-
-        validate_envelope(response)
-        assert response["status"] == "error"
-        assert response["error"]["type"] == "ModelError"
-        assert response["error"]["retryable"] is True
-
-
-def test_research_agent_empty_sources(temp_run_dir, mock_fallback_tracker):
+def test_research_agent_empty_sources(
+    tmp_path, mock_fallback_tracker, mock_empty_research_response
+):
     """Test handling of empty sources from LLM - memory bank fallback with user approval."""
     input_obj = {"topic": "Test topic"}
     context = {
         "run_id": "test-run-006",
-        "run_path": temp_run_dir,
+        "run_path": tmp_path,
         "fallback_tracker": mock_fallback_tracker,
     }
 
-    # Mock LLM response with empty sources
-    mock_research = {"sources": [], "summary": "No sources available"}
-    mock_llm_response = {
-        "text": json.dumps(mock_research),
-        "token_usage": {"prompt_tokens": 100, "completion_tokens": 50},
-        "model": "gemini-2.5-pro",
-    }
-
     with patch("agents.research_agent.get_text_client") as mock_client:
-        mock_client.return_value.generate_text.return_value = mock_llm_response
+        mock_client.return_value.generate_text.return_value = (
+            mock_empty_research_response
+        )
 
         response = run(input_obj, context)
 
@@ -217,25 +216,21 @@ def test_research_agent_empty_sources(temp_run_dir, mock_fallback_tracker):
     assert len(response["data"]["sources"]) >= 1
 
 
-def test_research_agent_user_rejects_fallback(temp_run_dir, mock_fallback_tracker):
+def test_research_agent_user_rejects_fallback(
+    tmp_path, mock_fallback_tracker, mock_empty_research_response
+):
     """Test research agent aborts when user rejects memory bank fallback."""
     input_obj = {"topic": "Test topic"}
     context = {
         "run_id": "test-run-007",
-        "run_path": temp_run_dir,
+        "run_path": tmp_path,
         "fallback_tracker": mock_fallback_tracker,
     }
 
-    # Mock LLM response with empty sources
-    mock_research = {"sources": [], "summary": "No sources available"}
-    mock_llm_response = {
-        "text": json.dumps(mock_research),
-        "token_usage": {"prompt_tokens": 100, "completion_tokens": 50},
-        "model": "gemini-2.5-pro",
-    }
-
     with patch("agents.research_agent.get_text_client") as mock_client:
-        mock_client.return_value.generate_text.return_value = mock_llm_response
+        mock_client.return_value.generate_text.return_value = (
+            mock_empty_research_response
+        )
 
         # Simulate user rejecting the fallback
         mock_fallback_tracker.request_user_approval.return_value = False
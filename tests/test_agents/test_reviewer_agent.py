@@ -1,10 +1,9 @@
 """Tests for reviewer_agent.py (Phase 7.6 - LLM-powered with grammar checking)."""
 
-import tempfile
-from pathlib import Path
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import DEFAULT, patch, MagicMock
 
+from agents import reviewer_agent
 from agents.reviewer_agent import (
     run,
     count_chars,
@@ -12,14 +11,32 @@ from agents.reviewer_agent import (
     _scrub_blacklisted_phrases,
 )
 from core.envelope import validate_envelope
+from tests.test_agents._helpers import assert_validation_error
 
+# Sample long draft (over 3000 chars)
+LONG_DRAFT = "A" * 3100
 
-@pytest.fixture
-def temp_run_dir():
-    """Create a temporary run directory."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        run_path = Path(tmpdir)
-        yield run_path
+# Body that fits under 3000 chars only once trailing hashtags are removed
+HASHTAG_BASE_TEXT = "A" * 2990
+
+# Patches both collaborators in one patcher; mocks arrive as **mocks keyed by name
+_patch_llm_and_grammar = patch.multiple(
+    reviewer_agent,
+    get_text_client=DEFAULT,
+    _apply_grammar_corrections=DEFAULT,
+)
+
+
+def _make_resp(text, prompt_tokens=100, completion_tokens=100):
+    """Build the LLM client's response dict for ``text``."""
+    return {
+        "text": text,
+        "token_usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+        },
+        "model": "gemini-2.5-pro",
+    }
 
 
 @pytest.fixture
@@ -38,12 +55,6 @@ Ever feel like Redis is a race car engine that's either overheating or underperf
 — Tech Audience Accelerator"""
 
 
-@pytest.fixture
-def sample_long_draft():
-    """Sample long draft (over 3000 chars)."""
-    return "A" * 3100
-
-
 @pytest.fixture
 def sample_draft_with_hashtags():
     """Sample draft with hashtags at the end."""
@@ -56,6 +67,12 @@ Great content here.
 #redis #optimization #performance #tech"""
 
 
+@pytest.fixture
+def llm_mock():
+    """LLM client mock limited to generate_text (no auto-created children)."""
+    return MagicMock(spec=["generate_text"])
+
+
 @pytest.fixture
 def mock_cost_tracker():
     """Mock cost tracker."""
@@ -65,28 +82,26 @@ def mock_cost_tracker():
     return mock_tracker
 
 
-@patch("agents.reviewer_agent.get_text_client")
-@patch("agents.reviewer_agent._apply_grammar_corrections")
-def test_reviewer_agent_success(
-    mock_grammar, mock_get_client, temp_run_dir, sample_short_draft, mock_cost_tracker
+@_patch_llm_and_grammar
+def test_reviewer_agent_success_and_shape(
+    tmp_path,
+    sample_short_draft,
+    mock_cost_tracker,
+    llm_mock,
+    **mocks,
 ):
-    """Test successful review with LLM and grammar checking."""
+    """Test a successful review run and the shape of its output data."""
     # Mock LLM client - must return dict with 'text' key
-    mock_client = MagicMock()
-    mock_client.generate_text.return_value = {
-        "text": sample_short_draft,
-        "token_usage": {"prompt_tokens": 200, "completion_tokens": 150},
-        "model": "gemini-2.5-pro",
-    }
-    mock_get_client.return_value = mock_client
+    llm_mock.generate_text.return_value = _make_resp(sample_short_draft, 200, 150)
+    mocks["get_text_client"].return_value = llm_mock
 
     # Mock grammar checking (no changes)
-    mock_grammar.return_value = (sample_short_draft, 0)
+    mocks["_apply_grammar_corrections"].return_value = (sample_short_draft, 0)
 
     input_obj = {"draft_text": sample_short_draft}
     context = {
         "run_id": "test-run-001",
-        "run_path": temp_run_dir,
+        "run_path": tmp_path,
         "cost_tracker": mock_cost_tracker,
     }
 
@@ -95,68 +110,79 @@ def test_reviewer_agent_success(
     # Validate envelope structure
     validate_envelope(response)
     assert response["status"] == "ok"
-    assert "revised" in response["data"]
-    assert "changes" in response["data"]
-    assert response["data"]["char_count"] < 3000
+    data = response["data"]
+
+    # Verify required fields
+    for key in (
+        "original",
+        "llm_revised",
+        "grammar_checked",
+        "revised",
+        "changes",
+        "char_count",
+        "iterations",
+    ):
+        assert key in data
+
+    # Verify changes structure
+    for key in (
+        "llm_changes",
+        "grammar_corrections",
+        "hashtags_removed",
+        "shortening_attempts",
+    ):
+        assert key in data["changes"]
+
+    assert data["char_count"] < 3000
 
     # Verify artifact persistence
-    artifact_path = temp_run_dir / "50_review.json"
+    artifact_path = tmp_path / "50_review.json"
     assert artifact_path.exists()
 
     # Ensure forbidden phrases are removed
-    assert "Tech Audience Accelerator" not in response["data"]["revised"]
+    assert "Tech Audience Accelerator" not in data["revised"]
 
     # Verify LLM was called
-    mock_client.generate_text.assert_called_once()
-    call_kwargs = mock_client.generate_text.call_args.kwargs
+    llm_mock.generate_text.assert_called_once()
+    call_kwargs = llm_mock.generate_text.call_args.kwargs
     assert call_kwargs["temperature"] == 0.3
     assert call_kwargs["use_search_grounding"] is False
 
 
-def test_reviewer_agent_missing_draft_text(temp_run_dir):
+def test_reviewer_agent_missing_draft_text(tmp_path):
     """Test error handling when draft_text is missing."""
     input_obj = {}
-    context = {"run_id": "test-run-002", "run_path": temp_run_dir}
+    context = {"run_id": "test-run-002", "run_path": tmp_path}
 
     response = run(input_obj, context)
 
-    validate_envelope(response)
-    assert response["status"] == "error"
-    assert response["error"]["type"] == "ValidationError"
-    assert response["error"]["retryable"] is False
+    assert_validation_error(response)
 
 
-@patch("agents.reviewer_agent.get_text_client")
-@patch("agents.reviewer_agent._apply_grammar_corrections")
+@_patch_llm_and_grammar
 def test_reviewer_agent_hashtag_removal(
-    mock_grammar,
-    mock_get_client,
-    temp_run_dir,
+    tmp_path,
     sample_draft_with_hashtags,
     mock_cost_tracker,
+    llm_mock,
+    **mocks,
 ):
     """Test automatic hashtag removal when post is too long."""
     # Create a version that's ~2990 chars + hashtags (total ~3020)
     # After hashtag removal, should be under 3000
-    base_text = "A" * 2990
-    long_with_hashtags = base_text + "\n\n#redis #optimization"
+    long_with_hashtags = HASHTAG_BASE_TEXT + "\n\n#redis #optimization"
 
     # Mock LLM to return the long draft - must return dict with 'text' key
-    mock_client = MagicMock()
-    mock_client.generate_text.return_value = {
-        "text": long_with_hashtags,
-        "token_usage": {"prompt_tokens": 200, "completion_tokens": 150},
-        "model": "gemini-2.5-pro",
-    }
-    mock_get_client.return_value = mock_client
+    llm_mock.generate_text.return_value = _make_resp(long_with_hashtags, 200, 150)
+    mocks["get_text_client"].return_value = llm_mock
 
     # Mock grammar checking (no changes)
-    mock_grammar.return_value = (long_with_hashtags, 0)
+    mocks["_apply_grammar_corrections"].return_value = (long_with_hashtags, 0)
 
     input_obj = {"draft_text": long_with_hashtags}
     context = {
         "run_id": "test-run-003",
-        "run_path": temp_run_dir,
+        "run_path": tmp_path,
         "cost_tracker": mock_cost_tracker,
     }
 
@@ -169,43 +195,39 @@ def test_reviewer_agent_hashtag_removal(
     assert response["data"]["char_count"] < 3000
 
 
-@patch("agents.reviewer_agent.get_text_client")
-@patch("agents.reviewer_agent._apply_grammar_corrections")
+@_patch_llm_and_grammar
 def test_reviewer_agent_shortening_loop(
-    mock_grammar,
-    mock_get_client,
-    temp_run_dir,
-    sample_long_draft,
+    tmp_path,
     sample_short_draft,
     mock_cost_tracker,
+    llm_mock,
+    **mocks,
 ):
     """Test shortening loop when post is too long."""
     # Mock LLM to return long draft first, then short draft - must return dict with 'text' key
-    mock_client = MagicMock()
-    mock_client.generate_text.side_effect = [
-        {
-            "text": sample_long_draft,
-            "token_usage": {"prompt_tokens": 100, "completion_tokens": 1000},
-            "model": "gemini-2.5-pro",
-        },
-        {
-            "text": sample_short_draft,
-            "token_usage": {"prompt_tokens": 100, "completion_tokens": 100},
-            "model": "gemini-2.5-pro",
-        },
+    responses = [
+        _make_resp(LONG_DRAFT, 100, 1000),
+        _make_resp(sample_short_draft),
     ]
-    mock_get_client.return_value = mock_client
+    prompts = []
+
+    def _record_prompt(**kwargs):
+        prompts.append(kwargs["prompt"])
+        return responses.pop(0)
+
+    llm_mock.generate_text.side_effect = _record_prompt
+    mocks["get_text_client"].return_value = llm_mock
 
     # Mock grammar checking (no changes)
-    mock_grammar.side_effect = [
-        (sample_long_draft, 0),
+    mocks["_apply_grammar_corrections"].side_effect = [
+        (LONG_DRAFT, 0),
         (sample_short_draft, 0),
     ]
 
-    input_obj = {"draft_text": sample_long_draft}
+    input_obj = {"draft_text": LONG_DRAFT}
     context = {
         "run_id": "test-run-004",
-        "run_path": temp_run_dir,
+        "run_path": tmp_path,
         "cost_tracker": mock_cost_tracker,
     }
 
@@ -214,36 +236,32 @@ def test_reviewer_agent_shortening_loop(
     # Should succeed after shortening
     assert response["status"] == "ok"
     assert response["data"]["iterations"] >= 2
-    assert mock_client.generate_text.call_count >= 2
+    assert len(prompts) >= 2
 
     # Verify second call included shortening context
-    second_call_prompt = mock_client.generate_text.call_args_list[1].kwargs["prompt"]
-    assert "too long" in second_call_prompt.lower()
-    assert "3000" in second_call_prompt
+    assert "too long" in prompts[1].lower()
+    assert "3000" in prompts[1]
 
 
-@patch("agents.reviewer_agent.get_text_client")
-@patch("agents.reviewer_agent._apply_grammar_corrections")
+@_patch_llm_and_grammar
 def test_reviewer_agent_max_shortening_attempts_exceeded(
-    mock_grammar, mock_get_client, temp_run_dir, sample_long_draft, mock_cost_tracker
+    tmp_path,
+    mock_cost_tracker,
+    llm_mock,
+    **mocks,
 ):
     """Test failure after max shortening attempts."""
     # Mock LLM to always return long draft - must return dict with 'text' key
-    mock_client = MagicMock()
-    mock_client.generate_text.return_value = {
-        "text": sample_long_draft,
-        "token_usage": {"prompt_tokens": 100, "completion_tokens": 1000},
-        "model": "gemini-2.5-pro",
-    }
-    mock_get_client.return_value = mock_client
+    llm_mock.generate_text.return_value = _make_resp(LONG_DRAFT, 100, 1000)
+    mocks["get_text_client"].return_value = llm_mock
 
     # Mock grammar checking (no changes)
-    mock_grammar.return_value = (sample_long_draft, 0)
+    mocks["_apply_grammar_corrections"].return_value = (LONG_DRAFT, 0)
 
-    input_obj = {"draft_text": sample_long_draft}
+    input_obj = {"draft_text": LONG_DRAFT}
     context = {
         "run_id": "test-run-005",
-        "run_path": temp_run_dir,
+        "run_path": tmp_path,
         "cost_tracker": mock_cost_tracker,
     }
 
@@ -256,27 +274,29 @@ def test_reviewer_agent_max_shortening_attempts_exceeded(
     assert response["error"]["retryable"] is False
 
     # Verify LLM was called 4 times (1 initial + 3 shortening)
-    assert mock_client.generate_text.call_count == 4
+    assert llm_mock.generate_text.call_count == 4
 
 
-@patch("agents.reviewer_agent.get_text_client")
-@patch("agents.reviewer_agent._apply_grammar_corrections")
+@_patch_llm_and_grammar
 def test_reviewer_agent_llm_failure(
-    mock_grammar, mock_get_client, temp_run_dir, sample_short_draft, mock_cost_tracker
+    tmp_path,
+    sample_short_draft,
+    mock_cost_tracker,
+    llm_mock,
+    **mocks,
 ):
     """Test error handling when LLM call fails."""
     # Mock LLM client to raise exception
-    mock_client = MagicMock()
-    mock_client.generate_text.side_effect = Exception("API timeout")
-    mock_get_client.return_value = mock_client
+    llm_mock.generate_text.side_effect = Exception("API timeout")
+    mocks["get_text_client"].return_value = llm_mock
 
     # Mock grammar checking
-    mock_grammar.return_value = (sample_short_draft, 0)
+    mocks["_apply_grammar_corrections"].return_value = (sample_short_draft, 0)
 
     input_obj = {"draft_text": sample_short_draft}
     context = {
         "run_id": "test-run-006",
-        "run_path": temp_run_dir,
+        "run_path": tmp_path,
         "cost_tracker": mock_cost_tracker,
     }
 
@@ -288,33 +308,51 @@ def test_reviewer_agent_llm_failure(
     assert "LLM review failed" in response["error"]["message"]
 
 
-@patch("agents.reviewer_agent._apply_grammar_corrections")
-def test_reviewer_agent_grammar_corrections(mock_grammar, temp_run_dir):
+@_patch_llm_and_grammar
+def test_reviewer_agent_grammar_corrections(tmp_path, llm_mock, **mocks):
     """Test that grammar corrections are applied."""
     original = "This is a tets post with errrors."
     corrected = "This is a test post with errors."
 
     # Mock grammar tool
-    mock_grammar.return_value = (corrected, 2)
+    mocks["_apply_grammar_corrections"].return_value = (corrected, 2)
 
     # We still need to mock LLM - must return dict with 'text' key
-    with patch("agents.reviewer_agent.get_text_client") as mock_get_client:
-        mock_client = MagicMock()
-        mock_client.generate_text.return_value = {
-            "text": original,
-            "token_usage": {"prompt_tokens": 50, "completion_tokens": 50},
-            "model": "gemini-2.5-pro",
-        }
-        mock_get_client.return_value = mock_client
+    llm_mock.generate_text.return_value = _make_resp(original, 50, 50)
+    mocks["get_text_client"].return_value = llm_mock
 
-        input_obj = {"draft_text": original}
-        context = {"run_id": "test-run-007", "run_path": temp_run_dir}
+    input_obj = {"draft_text": original}
+    context = {"run_id": "test-run-007", "run_path": tmp_path}
+
+    response = run(input_obj, context)
 
-        response = run(input_obj, context)
+    assert response["status"] == "ok"
+    assert response["data"]["changes"]["grammar_corrections"] == 2
+    assert response["data"]["grammar_checked"] == corrected
 
-        assert response["status"] == "ok"
-        assert response["data"]["changes"]["grammar_corrections"] == 2
-        assert response["data"]["grammar_checked"] == corrected
+
+@_patch_llm_and_grammar
+def test_reviewer_agent_skip_llm_review(
+    tmp_path, sample_short_draft, mock_cost_tracker, llm_mock, **mocks
+):
+    """Test skip_llm_review runs grammar and scrubbing without an LLM call."""
+    mocks["get_text_client"].return_value = llm_mock
+    mocks["_apply_grammar_corrections"].return_value = (sample_short_draft, 0)
+
+    input_obj = {"draft_text": sample_short_draft, "skip_llm_review": True}
+    context = {
+        "run_id": "test-run-008",
+        "run_path": tmp_path,
+        "cost_tracker": mock_cost_tracker,
+    }
+
+    response = run(input_obj, context)
+
+    assert response["status"] == "ok"
+    assert response["data"]["changes"]["llm_changes"] == "none"
+    assert "Tech Audience Accelerator" not in response["data"]["revised"]
+    llm_mock.generate_text.assert_not_called()
+    mock_cost_tracker.record_call.assert_not_called()
 
 
 def test_count_chars_excludes_newlines():
@@ -362,48 +400,3 @@ def test_remove_hashtags_no_hashtags():
 
     # Should return unchanged
     assert result == text_no_hashtags
-
-
-@patch("agents.reviewer_agent.get_text_client")
-@patch("agents.reviewer_agent._apply_grammar_corrections")
-def test_reviewer_agent_output_structure(
-    mock_grammar, mock_get_client, temp_run_dir, sample_short_draft, mock_cost_tracker
-):
-    """Test that output data structure is correct."""
-    # Mock LLM and grammar - must return dict with 'text' key
-    mock_client = MagicMock()
-    mock_client.generate_text.return_value = {
-        "text": sample_short_draft,
-        "token_usage": {"prompt_tokens": 100, "completion_tokens": 100},
-        "model": "gemini-2.5-pro",
-    }
-    mock_get_client.return_value = mock_client
-    mock_grammar.return_value = (sample_short_draft, 0)
-
-    input_obj = {"draft_text": sample_short_draft}
-    context = {
-        "run_id": "test-run-008",
-        "run_path": temp_run_dir,
-        "cost_tracker": mock_cost_tracker,
-    }
-
-    response = run(input_obj, context)
-
-    assert response["status"] == "ok"
-    data = response["data"]
-
-    # Verify required fields
-    assert "original" in data
-    assert "llm_revised" in data
-    assert "grammar_checked" in data
-    assert "revised" in data
-    assert "changes" in data
-    assert "char_count" in data
-    assert "iterations" in data
-
-    # Verify changes structure
-    changes = data["changes"]
-    assert "llm_changes" in changes
-    assert "grammar_corrections" in changes
-    assert "hashtags_removed" in changes
-    assert "shortening_attempts" in changes
@@ -1,20 +1,11 @@
 """Tests for strategic_type_agent.py."""
 
-import tempfile
-from pathlib import Path
 import pytest
-import json
+import orjson
 
 from agents.strategic_type_agent import run
 from core.envelope import validate_envelope
-
-
-@pytest.fixture
-def temp_run_dir():
-    """Create a temporary run directory."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        run_path = Path(tmpdir)
-        yield run_path
+from tests.test_agents._helpers import assert_validation_error
 
 
 @pytest.fixture
@@ -31,25 +22,15 @@ def sample_structured_prompt():
     }
 
 
-@pytest.fixture
-def sample_research():
-    """Sample research data."""
-    return {
-        "topic": "Redis optimization",
-        "sources": [{"title": "Redis patterns", "url": "https://example.com/1"}],
-        "summary": "Best practices for Redis in production",
-    }
-
-
 def test_strategic_type_agent_success(
-    temp_run_dir, sample_structured_prompt, sample_research
+    tmp_path, sample_structured_prompt, sample_research
 ):
     """Test successful strategy generation."""
     input_obj = {
         "structured_prompt": sample_structured_prompt,
         "research": sample_research,
     }
-    context = {"run_id": "test-run-001", "run_path": temp_run_dir}
+    context = {"run_id": "test-run-001", "run_path": tmp_path}
 
     response = run(input_obj, context)
 
@@ -60,50 +41,43 @@ def test_strategic_type_agent_success(
     assert "strategic_angle" in response["data"]
 
     # Verify artifact persistence
-    artifact_path = temp_run_dir / "30_strategy.json"
+    artifact_path = tmp_path / "30_strategy.json"
     assert artifact_path.exists()
 
-    with open(artifact_path) as f:
-        artifact_data = json.load(f)
+    artifact_data = orjson.loads(artifact_path.read_bytes())
     assert "structure" in artifact_data
     assert "strategic_angle" in artifact_data
 
 
-def test_strategic_type_agent_missing_structured_prompt(temp_run_dir, sample_research):
+def test_strategic_type_agent_missing_structured_prompt(tmp_path, sample_research):
     """Test error handling when structured_prompt is missing."""
     input_obj = {"research": sample_research}
-    context = {"run_id": "test-run-002", "run_path": temp_run_dir}
+    context = {"run_id": "test-run-002", "run_path": tmp_path}
 
     response = run(input_obj, context)
 
-    validate_envelope(response)
-    assert response["status"] == "error"
-    assert response["error"]["type"] == "ValidationError"
-    assert response["error"]["retryable"] is False
+    assert_validation_error(response)
 
 
-def test_strategic_type_agent_missing_research(temp_run_dir, sample_structured_prompt):
+def test_strategic_type_agent_missing_research(tmp_path, sample_structured_prompt):
     """Test error handling when research is missing."""
     input_obj = {"structured_prompt": sample_structured_prompt}
-    context = {"run_id": "test-run-003", "run_path": temp_run_dir}
+    context = {"run_id": "test-run-003", "run_path": tmp_path}
 
     response = run(input_obj, context)
 
-    validate_envelope(response)
-    assert response["status"] == "error"
-    assert response["error"]["type"] == "ValidationError"
-    assert response["error"]["retryable"] is False
+    assert_validation_error(response)
 
 
 def test_strategic_type_agent_structure_format(
-    temp_run_dir, sample_structured_prompt, sample_research
+    tmp_path, sample_structured_prompt, sample_research
 ):
     """Test that structure follows expected format."""
     input_obj = {
         "structured_prompt": sample_structured_prompt,
         "research": sample_research,
     }
-    context = {"run_id": "test-run-004", "run_path": temp_run_dir}
+    context = {"run_id": "test-run-004", "run_path": tmp_path}
 
     response = run(input_obj, context)
 
@@ -115,14 +89,14 @@ def test_strategic_type_agent_structure_format(
 
 
 def test_strategic_type_agent_uses_inputs(
-    temp_run_dir, sample_structured_prompt, sample_research
+    tmp_path, sample_structured_prompt, sample_research
 ):
     """Test that strategy indicates it used the provided inputs."""
     input_obj = {
         "structured_prompt": sample_structured_prompt,
         "research": sample_research,
     }
-    context = {"run_id": "test-run-005", "run_path": temp_run_dir}
+    context = {"run_id": "test-run-005", "run_path": tmp_path}
 
     response = run(input_obj, context)
 
@@ -1,57 +1,42 @@
 """Tests for topic_agent.py."""
 
-import tempfile
-from pathlib import Path
+import shutil
+
 import pytest
-import json
+import orjson
 from unittest.mock import patch
 
 from agents.topic_agent import run
 from core.envelope import validate_envelope
+from tests.test_agents._helpers import assert_validation_error
 from core.errors import ModelError
 from database.init_db import (
-    init_db,
     seed_potential_topics,
     DEFAULT_FIELD_DS,
     DEFAULT_FIELD_GAI,
 )
 
 
-@pytest.fixture
-def temp_db(tmp_path):
-    """Create a temporary database for testing."""
-    db_path = str(tmp_path / "test_topics.db")
-    init_db(db_path)
-    # Seed with test topics
+@pytest.fixture(scope="module")
+def seeded_template_db(schema_template_db):
+    """Template for ``fresh_db`` seeded with this module's test topics."""
+    db_path = schema_template_db.with_name("topic_agent_seeded.db")
+    shutil.copyfile(schema_template_db, db_path)
     seed_potential_topics(
         [
             ("Test topic 1", DEFAULT_FIELD_DS),
             ("Test topic 2", DEFAULT_FIELD_DS),
             ("Test topic 3", DEFAULT_FIELD_GAI),
         ],
-        db_path,
+        str(db_path),
     )
-
-    yield db_path
-
-    # Cleanup: Force garbage collection to release file handles
-    import gc
-
-    gc.collect()
+    return db_path
 
 
-@pytest.fixture
-def temp_run_dir():
-    """Create a temporary run directory."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        run_path = Path(tmpdir)
-        yield run_path
-
-
-def test_topic_agent_success(temp_db, temp_run_dir):
+def test_topic_agent_success(fresh_db, tmp_path):
     """Test successful topic selection."""
-    input_obj = {"field": DEFAULT_FIELD_DS, "db_path": temp_db}
-    context = {"run_id": "test-run-001", "run_path": temp_run_dir}
+    input_obj = {"field": DEFAULT_FIELD_DS, "db_path": fresh_db}
+    context = {"run_id": "test-run-001", "run_path": tmp_path}
 
     response = run(input_obj, context)
 
@@ -62,18 +47,17 @@ def test_topic_agent_success(temp_db, temp_run_dir):
     assert response["data"]["topic"] in ["Test topic 1", "Test topic 2"]
 
     # Verify artifact persistence
-    artifact_path = temp_run_dir / "10_topic.json"
+    artifact_path = tmp_path / "10_topic.json"
     assert artifact_path.exists()
 
-    with open(artifact_path) as f:
-        artifact_data = json.load(f)
+    artifact_data = orjson.loads(artifact_path.read_bytes())
     assert artifact_data["topic"] == response["data"]["topic"]
 
 
-def test_topic_agent_field_filtering(temp_db, temp_run_dir):
+def test_topic_agent_field_filtering(fresh_db, tmp_path):
     """Test that topics are filtered by field."""
-    input_obj = {"field": DEFAULT_FIELD_GAI, "db_path": temp_db}
-    context = {"run_id": "test-run-002", "run_path": temp_run_dir}
+    input_obj = {"field": DEFAULT_FIELD_GAI, "db_path": fresh_db}
+    context = {"run_id": "test-run-002", "run_path": tmp_path}
 
     response = run(input_obj, context)
 
@@ -81,28 +65,20 @@ def test_topic_agent_field_filtering(temp_db, temp_run_dir):
     assert response["data"]["topic"] == "Test topic 3"
 
 
-def test_topic_agent_missing_field(temp_run_dir):
+def test_topic_agent_missing_field(tmp_path):
     """Test error handling when field is missing."""
     input_obj = {}
-    context = {"run_id": "test-run-003", "run_path": temp_run_dir}
+    context = {"run_id": "test-run-003", "run_path": tmp_path}
 
     response = run(input_obj, context)
 
-    validate_envelope(response)
-    assert response["status"] == "error"
-    assert response["error"]["type"] == "ValidationError"
-    assert "field" in response["error"]["message"].lower()
-    assert response["error"]["retryable"] is False
+    assert_validation_error(response, contains="field")
 
 
-def test_topic_agent_no_available_topics(temp_run_dir, tmp_path):
+def test_topic_agent_no_available_topics(tmp_path, empty_db):
     """Test error when no topics are available and LLM fallback also fails."""
-    db_path = str(tmp_path / "empty_db.db")
-    init_db(db_path)
-    # Don't seed any topics
-
-    input_obj = {"field": DEFAULT_FIELD_DS, "db_path": db_path}
-    context = {"run_id": "test-run-004", "run_path": temp_run_dir}
+    input_obj = {"field": DEFAULT_FIELD_DS, "db_path": empty_db}
+    context = {"run_id": "test-run-004", "run_path": tmp_path}
 
     # Mock LLM to fail as well
     with patch("agents.topic_agent.get_text_client") as mock_client:
@@ -118,16 +94,11 @@ def test_topic_agent_no_available_topics(temp_run_dir, tmp_path):
         assert "llm fallback failed" in response["error"]["message"].lower()
         assert response["error"]["retryable"] is False
 
-    # Force garbage collection to release handles
-    import gc
-
-    gc.collect()
-
 
-def test_topic_agent_deterministic_selection(temp_db, temp_run_dir):
+def test_topic_agent_deterministic_selection(fresh_db, tmp_path):
     """Test that topic selection is deterministic (smallest id)."""
-    input_obj = {"field": DEFAULT_FIELD_DS, "db_path": temp_db}
-    context = {"run_id": "test-run-005", "run_path": temp_run_dir}
+    input_obj = {"field": DEFAULT_FIELD_DS, "db_path": fresh_db}
+    context = {"run_id": "test-run-005", "run_path": tmp_path}
 
     response1 = run(input_obj, context)
 
@@ -135,18 +106,14 @@ def test_topic_agent_deterministic_selection(temp_db, temp_run_dir):
     assert response1["data"]["topic"] == "Test topic 1"
 
 
-def test_topic_agent_llm_fallback_success(temp_run_dir, tmp_path):
+def test_topic_agent_llm_fallback_success(tmp_path, empty_db):
     """Test successful LLM fallback when database is empty."""
-    db_path = str(tmp_path / "empty_db.db")
-    init_db(db_path)
-    # Don't seed any topics
-
-    input_obj = {"field": DEFAULT_FIELD_DS, "db_path": db_path}
-    context = {"run_id": "test-run-006", "run_path": temp_run_dir}
+    input_obj = {"field": DEFAULT_FIELD_DS, "db_path": empty_db}
+    context = {"run_id": "test-run-006", "run_path": tmp_path}
 
     # Mock LLM to return valid topics
     mock_llm_response = {
-        "text": json.dumps(
+        "text": orjson.dumps(
             [
                 {
                     "topic": "LLM-generated topic about data optimization",
@@ -154,7 +121,7 @@ def test_topic_agent_llm_fallback_success(temp_run_dir, tmp_path):
                     "rationale": "Addresses emerging need for faster pipelines",
                 }
             ]
-        ),
+        ).decode(),
         "token_usage": {"prompt_tokens": 100, "completion_tokens": 200},
         "model": "gemini-2.5-pro",
     }
@@ -170,10 +137,5 @@ def test_topic_agent_llm_fallback_success(temp_run_dir, tmp_path):
         assert "LLM-generated" in response["data"]["topic"]
 
         # Verify artifact was created
-        artifact_path = temp_run_dir / "10_topic.json"
+        artifact_path = tmp_path / "10_topic.json"
         assert artifact_path.exists()
-
-    # Force garbage collection
-    import gc
-
-    gc.collect()
@@ -5,22 +5,24 @@ Contains long mock response strings for test fixtures.
 
 # flake8: noqa: E501
 
-import tempfile
 from pathlib import Path
-import pytest
-from unittest.mock import patch, MagicMock
 
-from agents.writer_agent import run, count_chars
+import orjson
+import pytest
+from unittest.mock import Mock, patch
+
+from agents import writer_agent
+from agents.writer_agent import (
+    _format_structured_prompt_as_user_message,
+    MAX_OUTPUT_TOKENS,
+    SELF_CRITIQUE_MIME_TYPE,
+    run,
+    count_chars,
+)
+from core.cost_tracking import CostTracker
 from core.envelope import validate_envelope
 from core.fallback_tracker import FallbackTracker
-
-
-@pytest.fixture
-def temp_run_dir():
-    """Create a temporary run directory."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        run_path = Path(tmpdir)
-        yield run_path
+from core.llm_clients import GeminiTextClient
 
 
 @pytest.fixture
@@ -74,50 +76,54 @@ Great content here.
 @pytest.fixture
 def mock_cost_tracker():
     """Mock cost tracker."""
-    mock_tracker = MagicMock()
-    mock_tracker.check_budget = MagicMock()
-    mock_tracker.record_call = MagicMock()
-    return mock_tracker
+    return Mock(spec=CostTracker)
+
+
+@pytest.fixture
+def writer_llm():
+    """Patch the writer's prompt loader and LLM client; yield the client mock.
+
+    The client is specced on GeminiTextClient, so misspelled methods fail
+    instead of silently returning child mocks.
+    """
+    client = Mock(spec=GeminiTextClient)
+    with patch.multiple(
+        writer_agent,
+        load_system_prompt=Mock(return_value="You are the Witty Expert persona."),
+        get_text_client=Mock(return_value=client),
+    ):
+        yield client
 
 
 @pytest.fixture
-def mock_fallback_tracker():
+def mock_fallback_tracker(tmp_path):
     """Mock fallback tracker."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        mock_tracker = FallbackTracker(Path(tmpdir))
-        mock_tracker.record_warning = MagicMock()
-        mock_tracker.request_user_approval = MagicMock(return_value=True)
-        yield mock_tracker
+    mock_tracker = FallbackTracker(tmp_path)
+    mock_tracker.record_warning = Mock()
+    mock_tracker.request_user_approval = Mock(return_value=True)
+    return mock_tracker
 
 
-@patch("agents.writer_agent.load_system_prompt")
-@patch("agents.writer_agent.get_text_client")
 def test_writer_agent_success(
-    mock_get_client,
-    mock_load_prompt,
-    temp_run_dir,
+    writer_llm,
+    tmp_path,
     sample_structured_prompt,
     mock_short_draft,
     mock_cost_tracker,
 ):
     """Test successful draft writing with LLM."""
-    # Mock system prompt loader
-    mock_load_prompt.return_value = "You are the Witty Expert persona."
-
     # Mock LLM client
-    mock_client = MagicMock()
-    mock_client.generate_text.return_value = {
+    writer_llm.generate_text.return_value = {
         "text": mock_short_draft,
         "token_usage": {"prompt_tokens": 100, "completion_tokens": 200},
     }
-    mock_get_client.return_value = mock_client
 
     input_obj = {
         "structured_prompt": sample_structured_prompt,
     }
     context = {
         "run_id": "test-run-001",
-        "run_path": temp_run_dir,
+        "run_path": tmp_path,
         "cost_tracker": mock_cost_tracker,
     }
 
@@ -129,7 +135,7 @@ def test_writer_agent_success(
     assert "draft_path" in response["data"]
 
     # Verify artifact persistence
-    artifact_path = temp_run_dir / "40_draft.md"
+    artifact_path = tmp_path / "40_draft.md"
     assert artifact_path.exists()
 
     draft_text = artifact_path.read_text()
@@ -139,16 +145,18 @@ def test_writer_agent_success(
     assert "race car" in draft_text
 
     # Verify LLM was called
-    mock_client.generate_text.assert_called_once()
-    call_kwargs = mock_client.generate_text.call_args.kwargs
+    writer_llm.generate_text.assert_called_once()
+    call_kwargs = writer_llm.generate_text.call_args.kwargs
     assert call_kwargs["temperature"] == 0.8
     assert call_kwargs["use_search_grounding"] is False
+    assert call_kwargs["max_output_tokens"] == MAX_OUTPUT_TOKENS
+    assert "stop_sequences" not in call_kwargs
 
 
-def test_writer_agent_missing_structured_prompt(temp_run_dir):
+def test_writer_agent_missing_structured_prompt(tmp_path):
     """Test error handling when structured_prompt is missing."""
     input_obj = {}
-    context = {"run_id": "test-run-002", "run_path": temp_run_dir}
+    context = {"run_id": "test-run-002", "run_path": tmp_path}
 
     response = run(input_obj, context)
 
@@ -158,24 +166,17 @@ def test_writer_agent_missing_structured_prompt(temp_run_dir):
     assert response["error"]["retryable"] is False
 
 
-@patch("agents.writer_agent.load_system_prompt")
-@patch("agents.writer_agent.get_text_client")
 def test_writer_agent_character_count_loop(
-    mock_get_client,
-    mock_load_prompt,
-    temp_run_dir,
+    writer_llm,
+    tmp_path,
     sample_structured_prompt,
     mock_long_draft,
     mock_short_draft,
     mock_cost_tracker,
 ):
     """Test internal character count shortening loop."""
-    # Mock system prompt loader
-    mock_load_prompt.return_value = "You are the Witty Expert persona."
-
     # Mock LLM client to return long draft first, then short draft
-    mock_client = MagicMock()
-    mock_client.generate_text.side_effect = [
+    writer_llm.generate_text.side_effect = [
         {
             "text": mock_long_draft,
             "token_usage": {"prompt_tokens": 100, "completion_tokens": 200},
@@ -185,14 +186,13 @@ def test_writer_agent_character_count_loop(
             "token_usage": {"prompt_tokens": 150, "completion_tokens": 250},
         },
     ]
-    mock_get_client.return_value = mock_client
 
     input_obj = {
         "structured_prompt": sample_structured_prompt,
     }
     context = {
         "run_id": "test-run-003",
-        "run_path": temp_run_dir,
+        "run_path": tmp_path,
         "cost_tracker": mock_cost_tracker,
     }
 
@@ -202,43 +202,38 @@ def test_writer_agent_character_count_loop(
     assert response["status"] == "ok"
 
     # Verify LLM was called twice (once for initial, once for shortening)
-    assert mock_client.generate_text.call_count == 2
+    assert writer_llm.generate_text.call_count == 2
 
     # Verify second call included shortening context
-    second_call_prompt = mock_client.generate_text.call_args_list[1].kwargs["prompt"]
+    second_call_prompt = writer_llm.generate_text.call_args_list[1].kwargs["prompt"]
     assert "IMPORTANT: Character Count Issue" in second_call_prompt
     assert mock_long_draft in second_call_prompt
+    assert "3100 characters" in second_call_prompt
+    # The retry sends only the draft, not the original structured prompt again
+    assert sample_structured_prompt["pain_point"] not in second_call_prompt
 
 
-@patch("agents.writer_agent.load_system_prompt")
-@patch("agents.writer_agent.get_text_client")
 def test_writer_agent_max_shortening_attempts_exceeded(
-    mock_get_client,
-    mock_load_prompt,
-    temp_run_dir,
+    writer_llm,
+    tmp_path,
     sample_structured_prompt,
     mock_long_draft,
     mock_cost_tracker,
     mock_fallback_tracker,
 ):
     """Test failure after max shortening attempts."""
-    # Mock system prompt loader
-    mock_load_prompt.return_value = "You are the Witty Expert persona."
-
     # Mock LLM client to always return long draft
-    mock_client = MagicMock()
-    mock_client.generate_text.return_value = {
+    writer_llm.generate_text.return_value = {
         "text": mock_long_draft,
         "token_usage": {"prompt_tokens": 100, "completion_tokens": 200},
     }
-    mock_get_client.return_value = mock_client
 
     input_obj = {
         "structured_prompt": sample_structured_prompt,
     }
     context = {
         "run_id": "test-run-004",
-        "run_path": temp_run_dir,
+        "run_path": tmp_path,
         "cost_tracker": mock_cost_tracker,
         "fallback_tracker": mock_fallback_tracker,
     }
@@ -251,37 +246,31 @@ def test_writer_agent_max_shortening_attempts_exceeded(
     # Should fail after exhausting shortening attempts and user rejection
     assert response["status"] == "error"
     assert response["error"]["type"] == "ValidationError"
-    assert "still 3100 chars after 3 shortening attempts" in response["error"]["message"]
+    assert (
+        "still 3100 chars after 3 shortening attempts" in response["error"]["message"]
+    )
 
     # Verify LLM was called 4 times (1 initial + 3 shortening)
-    assert mock_client.generate_text.call_count == 4
+    assert writer_llm.generate_text.call_count == 4
 
 
-@patch("agents.writer_agent.load_system_prompt")
-@patch("agents.writer_agent.get_text_client")
 def test_writer_agent_llm_failure(
-    mock_get_client,
-    mock_load_prompt,
-    temp_run_dir,
+    writer_llm,
+    tmp_path,
     sample_structured_prompt,
     mock_cost_tracker,
     mock_fallback_tracker,
 ):
     """Test error handling when LLM call fails."""
-    # Mock system prompt loader
-    mock_load_prompt.return_value = "You are the Witty Expert persona."
-
     # Mock LLM client to raise exception
-    mock_client = MagicMock()
-    mock_client.generate_text.side_effect = Exception("API timeout")
-    mock_get_client.return_value = mock_client
+    writer_llm.generate_text.side_effect = Exception("API timeout")
 
     input_obj = {
         "structured_prompt": sample_structured_prompt,
     }
     context = {
         "run_id": "test-run-005",
-        "run_path": temp_run_dir,
+        "run_path": tmp_path,
         "cost_tracker": mock_cost_tracker,
         "fallback_tracker": mock_fallback_tracker,
     }
@@ -301,33 +290,26 @@ def test_count_chars_excludes_newlines():
     assert count_chars(text_with_newlines) == len("HelloWorldTest")
 
 
-@patch("agents.writer_agent.load_system_prompt")
-@patch("agents.writer_agent.get_text_client")
 def test_writer_agent_formats_prompt_correctly(
-    mock_get_client,
-    mock_load_prompt,
-    temp_run_dir,
+    writer_llm,
+    tmp_path,
     sample_structured_prompt,
     mock_short_draft,
     mock_cost_tracker,
 ):
     """Test that structured prompt is formatted correctly for LLM."""
-    # Mock system prompt loader
-    mock_load_prompt.return_value = "You are the Witty Expert persona."
 
-    mock_client = MagicMock()
-    mock_client.generate_text.return_value = {
+    writer_llm.generate_text.return_value = {
         "text": mock_short_draft,
         "token_usage": {"prompt_tokens": 100, "completion_tokens": 200},
     }
-    mock_get_client.return_value = mock_client
 
     input_obj = {
         "structured_prompt": sample_structured_prompt,
     }
     context = {
         "run_id": "test-run-007",
-        "run_path": temp_run_dir,
+        "run_path": tmp_path,
         "cost_tracker": mock_cost_tracker,
     }
 
@@ -336,45 +318,94 @@ def test_writer_agent_formats_prompt_correctly(
     assert response["status"] == "ok"
 
     # Verify prompt contains key elements
-    call_prompt = mock_client.generate_text.call_args.kwargs["prompt"]
+    call_prompt = writer_llm.generate_text.call_args.kwargs["prompt"]
     assert "Redis Optimization Strategies" in call_prompt
     assert "Hard to balance memory vs latency" in call_prompt
     assert "Like tuning a race car engine" in call_prompt
-    assert "Do NOT mention \"Tech Audience Accelerator\"" in call_prompt
+    assert 'Do NOT mention "Tech Audience Accelerator"' in call_prompt
     assert "— Tech Audience Accelerator" not in call_prompt
 
 
-@patch("agents.writer_agent.load_system_prompt")
-@patch("agents.writer_agent.get_text_client")
+def test_writer_agent_self_critique_returns_score(
+    writer_llm, tmp_path, sample_structured_prompt, mock_short_draft
+):
+    """Test self-critique mode requests JSON and surfaces the score."""
+    writer_llm.generate_text.return_value = {
+        "text": orjson.dumps(
+            {"draft": mock_short_draft, "self_critique_score": 0.85}
+        ).decode(),
+        "token_usage": {},
+    }
+
+    input_obj = {"structured_prompt": sample_structured_prompt, "self_critique": True}
+    context = {"run_id": "test-run-010", "run_path": tmp_path}
+
+    response = run(input_obj, context)
+
+    assert response["status"] == "ok"
+    assert response["data"]["self_critique_score"] == 0.85
+    assert (tmp_path / "40_draft.md").read_text(encoding="utf-8") == mock_short_draft
+
+    call_kwargs = writer_llm.generate_text.call_args.kwargs
+    assert call_kwargs["response_mime_type"] == SELF_CRITIQUE_MIME_TYPE
+    assert "self_critique_score" in call_kwargs["prompt"]
+
+
+def test_writer_agent_self_critique_tolerates_plain_reply(
+    writer_llm, tmp_path, sample_structured_prompt, mock_short_draft
+):
+    """Test a non-JSON self-critique reply is kept as the draft with no score."""
+    writer_llm.generate_text.return_value = {
+        "text": mock_short_draft,
+        "token_usage": {},
+    }
+
+    input_obj = {"structured_prompt": sample_structured_prompt, "self_critique": True}
+    context = {"run_id": "test-run-011", "run_path": tmp_path}
+
+    response = run(input_obj, context)
+
+    assert response["status"] == "ok"
+    assert response["data"]["self_critique_score"] is None
+    assert "Redis Optimization" in (tmp_path / "40_draft.md").read_text(
+        encoding="utf-8"
+    )
+
+
+def test_legacy_prompt_fields_fall_back_to_defaults():
+    """Test missing legacy dict fields use their defaults."""
+    message = _format_structured_prompt_as_user_message({"analogy": "A relay race"})
+
+    assert "**Topic:** Unknown Topic" in message
+    assert "**Target Audience:** technical professionals" in message
+    assert "**The Perfect Analogy:** A relay race" in message
+
+
 def test_writer_agent_scrubs_blacklisted_phrase(
-    mock_get_client,
-    mock_load_prompt,
-    temp_run_dir,
+    writer_llm,
+    tmp_path,
     sample_structured_prompt,
     mock_short_draft_with_blacklist,
     mock_cost_tracker,
 ):
     """Ensure writer removes forbidden phrases before saving draft."""
-    mock_load_prompt.return_value = "You are the Witty Expert persona."
 
-    mock_client = MagicMock()
-    mock_client.generate_text.return_value = {
+    writer_llm.generate_text.return_value = {
         "text": mock_short_draft_with_blacklist,
         "token_usage": {"prompt_tokens": 100, "completion_tokens": 200},
     }
-    mock_get_client.return_value = mock_client
 
     input_obj = {"structured_prompt": sample_structured_prompt}
     context = {
         "run_id": "test-run-009",
-        "run_path": temp_run_dir,
+        "run_path": tmp_path,
         "cost_tracker": mock_cost_tracker,
     }
 
     response = run(input_obj, context)
 
     assert response["status"] == "ok"
-    artifact_path = temp_run_dir / "40_draft.md"
+    artifact_path = tmp_path / "40_draft.md"
     saved_text = artifact_path.read_text()
 
     assert "Tech Audience Accelerator" not in saved_text
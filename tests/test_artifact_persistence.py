@@ -10,14 +10,17 @@ This module provides comprehensive tests for:
 - Disk space and permission error handling
 """
 
+import errno
+import importlib.util
 import pytest
 import json
 import os
-import tempfile
 import threading
 import time
+from pathlib import Path
 from unittest.mock import patch
 
+import core.persistence as persistence
 from core.persistence import (
     atomic_write_json,
     atomic_write_text,
@@ -27,7 +30,6 @@ from core.persistence import (
 )
 from core.errors import CorruptionError
 
-
 # =============================================================================
 # Test Suite: Atomic JSON Write Operations
 # =============================================================================
@@ -41,22 +43,22 @@ class TestAtomicJsonWrite:
         target_path = tmp_path / "test.json"
         test_data = {"key": "value"}
 
-        # Track temp files during write
+        # Track temp files renamed into place during write
         temp_files = []
-        original_mkstemp = tempfile.mkstemp
+        original_replace = os.replace
 
-        def tracking_mkstemp(*args, **kwargs):
-            fd, path = original_mkstemp(*args, **kwargs)
-            temp_files.append(path)
-            return fd, path
+        def tracking_replace(src, dst):
+            temp_files.append(str(src))
+            return original_replace(src, dst)
 
-        with patch("core.persistence.tempfile.mkstemp", side_effect=tracking_mkstemp):
+        with patch("core.persistence.os.replace", side_effect=tracking_replace):
             atomic_write_json(target_path, test_data)
 
         # Temp file should have been created (and cleaned up)
         assert len(temp_files) == 1
         # Temp file should have .tmp suffix
         assert temp_files[0].endswith(".tmp")
+        assert not os.path.exists(temp_files[0])
 
     def test_rename_operation_is_atomic(self, tmp_path):
         """Test rename operation is atomic (no partial writes visible)."""
@@ -80,10 +82,9 @@ class TestAtomicJsonWrite:
         with open(target_path, "w", encoding="utf-8") as f:
             json.dump(original_data, f)
 
-        # Simulate write failure during dump
-        with patch("json.dump", side_effect=TypeError("Serialization failed")):
-            with pytest.raises(TypeError):
-                atomic_write_json(target_path, {"new": "data"})
+        # Unserializable payload fails during serialization
+        with pytest.raises(TypeError):
+            atomic_write_json(target_path, {"new": object()})
 
         # Original file should be intact
         with open(target_path, "r", encoding="utf-8") as f:
@@ -153,14 +154,13 @@ class TestAtomicTextWrite:
         test_content = "Hello, World!"
 
         temp_files = []
-        original_mkstemp = tempfile.mkstemp
+        original_replace = os.replace
 
-        def tracking_mkstemp(*args, **kwargs):
-            fd, path = original_mkstemp(*args, **kwargs)
-            temp_files.append(path)
-            return fd, path
+        def tracking_replace(src, dst):
+            temp_files.append(str(src))
+            return original_replace(src, dst)
 
-        with patch("core.persistence.tempfile.mkstemp", side_effect=tracking_mkstemp):
+        with patch("core.persistence.os.replace", side_effect=tracking_replace):
             atomic_write_text(target_path, test_content)
 
         assert len(temp_files) == 1
@@ -243,15 +243,26 @@ class TestJsonVerification:
 
         assert "corrupted" in str(exc_info.value).lower()
 
-    def test_write_and_verify_json_reparses_after_write(self, tmp_path):
-        """Test write_and_verify_json() immediately re-parses after write."""
+    def test_write_and_verify_json_bytes_match(self, tmp_path):
+        """Test write_and_verify_json() checks the bytes and returns a parsed copy."""
         target_path = tmp_path / "verified.json"
-        test_data = {"verified": True}
+        test_data = {"verified": True, "pair": (1, 2)}
 
-        result = write_and_verify_json(target_path, test_data)
+        with patch("core.persistence.verify_json") as mock_verify:
+            result = write_and_verify_json(target_path, test_data)
 
-        assert result == test_data
-        assert target_path.exists()
+        assert result == {"verified": True, "pair": [1, 2]}
+        assert result is not test_data
+        mock_verify.assert_not_called()
+        assert verify_json(target_path) == result
+
+    def test_write_and_verify_json_detects_mismatched_bytes(self, tmp_path):
+        """Test bytes on disk that differ from the payload are fully verified."""
+        target_path = tmp_path / "verified.json"
+
+        with patch.object(Path, "read_bytes", return_value=b'{"verified": tr'):
+            with pytest.raises(CorruptionError):
+                write_and_verify_json(target_path, {"verified": True})
 
     def test_truncated_json_detected_as_corrupted(self, tmp_path):
         """Test truncated JSON file is detected as corrupted."""
@@ -433,26 +444,79 @@ class TestDiskErrorHandling:
         """Test graceful failure if write fails."""
         target_path = tmp_path / "write_fail.json"
 
-        with patch("os.fdopen", side_effect=OSError("Disk full")):
+        with patch("os.write", side_effect=OSError("Disk full")):
             with pytest.raises(OSError):
                 atomic_write_json(target_path, {"data": "test"})
 
+        assert not target_path.exists()
+        assert not [f for f in tmp_path.iterdir() if ".tmp" in f.name]
+
+    def test_durable_flag_controls_fsync(self, tmp_path, monkeypatch):
+        """Test fsync runs only for durable writes; the default is configurable."""
+        target_path = tmp_path / "durable.json"
+
+        with patch("core.persistence.os.fsync") as mock_fsync:
+            atomic_write_json(target_path, {"n": 1}, durable=False)
+            assert mock_fsync.call_count == 0
+
+            atomic_write_json(target_path, {"n": 2}, durable=True)
+            assert mock_fsync.call_count == 1
+
+            monkeypatch.setattr(persistence, "DURABLE_WRITES", True)
+            write_and_verify_json(target_path, {"n": 3})
+            assert mock_fsync.call_count == 2
+
+        assert verify_json(target_path) == {"n": 3}
+
     def test_temp_file_cleanup_after_failed_write(self, tmp_path):
         """Test cleanup of temp files after failed writes."""
         target_path = tmp_path / "cleanup_test.json"
 
+        def tmp_count():
+            with os.scandir(tmp_path) as entries:
+                return sum(1 for entry in entries if entry.name.endswith(".tmp"))
+
         # Count temp files before
-        initial_files = set(tmp_path.iterdir())
+        before = tmp_count()
 
-        # Simulate failure during json.dump
-        with patch("json.dump", side_effect=RuntimeError("Serialization failed")):
+        # Simulate failure during the temp-file write
+        with patch("os.fsync", side_effect=RuntimeError("Write failed")):
             with pytest.raises(RuntimeError):
-                atomic_write_json(target_path, {"data": "test"})
+                atomic_write_json(target_path, {"data": "test"}, durable=True)
 
         # Temp file should be cleaned up
-        final_files = set(tmp_path.iterdir())
-        temp_files = [f for f in (final_files - initial_files) if ".tmp" in f.name]
-        assert len(temp_files) == 0
+        assert tmp_count() == before
+
+    def test_anonymous_temp_falls_back_when_rejected(self, tmp_path, monkeypatch):
+        """Test a rejected O_TMPFILE link falls back to a named temp file."""
+        target_path = tmp_path / "fallback.json"
+        monkeypatch.setattr(persistence, "_use_anonymous_temp", True)
+
+        exdev = OSError(errno.EXDEV, "Invalid cross-device link")
+        with patch("core.persistence.os.link", side_effect=exdev):
+            atomic_write_json(target_path, {"n": 1})
+
+        assert verify_json(target_path) == {"n": 1}
+        assert persistence._use_anonymous_temp is False
+        assert not [f for f in tmp_path.iterdir() if ".tmp" in f.name]
+
+    @pytest.mark.skipif(not hasattr(os, "O_TMPFILE"), reason="O_TMPFILE is Linux-only")
+    def test_anonymous_temp_failure_needs_no_cleanup(self, tmp_path, monkeypatch):
+        """Test a failed write to an unnamed temp file leaves nothing to unlink."""
+        target_path = tmp_path / "anonymous.json"
+        monkeypatch.setattr(persistence, "_use_anonymous_temp", True)
+
+        with patch(
+            "core.persistence.os.fsync", side_effect=RuntimeError("Write failed")
+        ):
+            with patch("core.persistence.os.unlink") as mock_unlink:
+                with pytest.raises(RuntimeError):
+                    atomic_write_json(target_path, {"data": "test"}, durable=True)
+
+        if not persistence._use_anonymous_temp:
+            pytest.skip("O_TMPFILE not supported on this filesystem")
+        mock_unlink.assert_not_called()
+        assert list(tmp_path.iterdir()) == []
 
 
 # =============================================================================
@@ -463,37 +527,79 @@ class TestDiskErrorHandling:
 class TestCharacterCounting:
     """Test character counting utility for LinkedIn post validation."""
 
-    def test_count_chars_basic(self):
-        """Test basic character counting."""
-        assert count_chars("Hello") == 5
-        assert count_chars("Hello, World!") == 13
-
-    def test_count_chars_with_newlines(self):
-        """Test character counting includes newlines."""
-        text = "Line 1\nLine 2"
-        assert count_chars(text) == 13  # 6 + 1 + 6
-
-    def test_count_chars_with_spaces(self):
-        """Test character counting includes spaces."""
-        assert count_chars("Hello World") == 11
-        assert count_chars("   ") == 3
-
-    def test_count_chars_empty_string(self):
-        """Test counting empty string returns 0."""
-        assert count_chars("") == 0
-
-    def test_count_chars_unicode(self):
-        """Test counting Unicode characters."""
-        # Each emoji is counted as one character in Python
-        text = "🚀💻🔥"
-        assert count_chars(text) == 3
-
-    def test_count_chars_linkedin_limit(self):
-        """Test character counting for LinkedIn limit validation."""
-        under_limit = "A" * 2999
-        at_limit = "A" * 3000
-        over_limit = "A" * 3001
-
-        assert count_chars(under_limit) < 3000
-        assert count_chars(at_limit) == 3000
-        assert count_chars(over_limit) > 3000
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("Hello", 5),
+            ("Hello, World!", 13),
+            ("Line 1\nLine 2", 13),  # newlines are counted: 6 + 1 + 6
+            ("Hello World", 11),
+            ("   ", 3),
+            ("", 0),
+            ("🚀💻🔥", 3),  # each emoji is one character in Python
+            ("A" * 2999, 2999),  # LinkedIn limit boundaries
+            ("A" * 3000, 3000),
+            ("A" * 3001, 3001),
+        ],
+        ids=[
+            "basic",
+            "punctuation",
+            "newline",
+            "spaces",
+            "whitespace-only",
+            "empty",
+            "unicode",
+            "under-limit",
+            "at-limit",
+            "over-limit",
+        ],
+    )
+    def test_count_chars(self, text, expected):
+        """Test character counting, including whitespace, unicode and limits."""
+        assert count_chars(text) == expected
+
+
+# =============================================================================
+# Test Suite: Performance Guardrails
+# =============================================================================
+
+
+def _assert_mean_below(benchmark, budget_s):
+    """Assert the benchmark's mean time is within budget (seconds).
+
+    Benchmarks are disabled under xdist or --benchmark-disable; the timed
+    function still runs once there, but no stats are collected to check.
+    """
+    if benchmark.disabled:
+        return
+    assert benchmark.stats.stats.mean < budget_s
+
+
+@pytest.mark.perf
+@pytest.mark.skipif(
+    importlib.util.find_spec("pytest_benchmark") is None,
+    reason="pytest-benchmark not installed",
+)
+@pytest.mark.benchmark(max_time=0.2, min_rounds=20)
+class TestPerformanceBudgets:
+    """Time budgets that fail on regressions of the persistence fast paths."""
+
+    def test_write_and_verify_json_perf(self, benchmark, tmp_path):
+        """Test a 1000-item artifact writes and verifies within 2 ms."""
+        data = {"k": list(range(1000))}
+        benchmark(write_and_verify_json, tmp_path / "p.json", data)
+        _assert_mean_below(benchmark, 0.002)
+
+    def test_count_chars_perf(self, benchmark):
+        """Test counting a 3000-char post takes under 10 µs."""
+        text = ("Line of post text\n" * 167)[:3000]
+        benchmark(count_chars, text)
+        _assert_mean_below(benchmark, 10e-6)
+
+    def test_verify_json_perf(self, benchmark, tmp_path):
+        """Test verifying a ~100 KB artifact takes under 300 µs."""
+        target_path = tmp_path / "large.json"
+        atomic_write_json(target_path, {"rows": ["x" * 90] * 1000})
+        assert 90_000 < target_path.stat().st_size < 110_000
+        benchmark(verify_json, target_path)
+        _assert_mean_below(benchmark, 300e-6)
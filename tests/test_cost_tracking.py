@@ -14,20 +14,32 @@ from core.cost_tracking import (
 from core.errors import ValidationError
 
 
+@pytest.fixture(scope="module")
+def std_metrics():
+    """Standard 1000-in/500-out Pro call; CostMetrics is never mutated by tracking."""
+    return CostMetrics(model="gemini-2.5-pro", input_tokens=1000, output_tokens=500)
+
+
+@pytest.fixture
+def make_tracker():
+    """Factory for trackers, defaulting to a $1.00 / 10-call budget."""
+
+    def _make(max_cost_usd=1.0, max_api_calls=10):
+        return CostTracker(max_cost_usd=max_cost_usd, max_api_calls=max_api_calls)
+
+    return _make
+
+
 class TestCostMetrics:
     """Test cost calculation for individual LLM calls."""
 
-    def test_text_generation_cost(self):
+    def test_text_generation_cost(self, std_metrics):
         """Test cost calculation for text generation."""
-        metrics = CostMetrics(
-            model="gemini-2.5-pro", input_tokens=1000, output_tokens=500
-        )
-
         expected_input = (1000 / 1_000_000) * GEMINI_PRO_INPUT_PRICE
         expected_output = (500 / 1_000_000) * GEMINI_PRO_OUTPUT_PRICE
         expected_total = expected_input + expected_output
 
-        assert metrics.cost_usd == pytest.approx(expected_total)
+        assert std_metrics.cost_usd == pytest.approx(expected_total)
 
     def test_image_generation_cost(self):
         """Test cost calculation for image generation."""
@@ -43,60 +55,55 @@ class TestCostMetrics:
 
         assert metrics.cost_usd == 0.0
 
+    def test_unknown_model_uses_pro_pricing(self, std_metrics):
+        """Test unrecognized text models are priced like Gemini Pro."""
+        metrics = CostMetrics(
+            model="some-future-model", input_tokens=1000, output_tokens=500
+        )
+
+        assert metrics.cost_usd == pytest.approx(std_metrics.cost_usd)
+
 
 class TestCostTracker:
     """Test cost tracking across a run."""
 
-    def test_record_single_call(self):
+    def test_record_single_call(self, make_tracker, std_metrics):
         """Test recording a single API call."""
-        tracker = CostTracker(max_cost_usd=1.0, max_api_calls=10)
+        tracker = make_tracker()
 
-        metrics = CostMetrics(
-            model="gemini-2.5-pro", input_tokens=1000, output_tokens=500
-        )
-
-        tracker.record_call("test_agent", metrics)
+        tracker.record_call("test_agent", std_metrics)
 
         assert tracker.api_call_count == 1
         assert tracker.total_cost_usd > 0
         assert "test_agent" in tracker.costs_by_agent
         assert tracker.calls_by_agent["test_agent"] == 1
 
-    def test_record_multiple_calls(self):
+    def test_record_multiple_calls(self, make_tracker, std_metrics):
         """Test recording multiple API calls."""
-        tracker = CostTracker(max_cost_usd=1.0, max_api_calls=10)
+        tracker = make_tracker()
 
         # Record 3 calls
         for i in range(3):
-            metrics = CostMetrics(
-                model="gemini-2.5-pro", input_tokens=1000, output_tokens=500
-            )
-            tracker.record_call(f"agent_{i}", metrics)
+            tracker.record_call(f"agent_{i}", std_metrics)
 
         assert tracker.api_call_count == 3
         assert len(tracker.costs_by_agent) == 3
 
-    def test_max_api_calls_exceeded(self):
+    def test_max_api_calls_exceeded(self, make_tracker, std_metrics):
         """Test that exceeding max API calls raises error."""
-        tracker = CostTracker(max_cost_usd=10.0, max_api_calls=2)
+        tracker = make_tracker(max_cost_usd=10.0, max_api_calls=2)
 
         # Record 2 calls (should succeed)
         for i in range(2):
-            metrics = CostMetrics(
-                model="gemini-2.5-pro", input_tokens=100, output_tokens=50
-            )
-            tracker.record_call(f"agent_{i}", metrics)
+            tracker.record_call(f"agent_{i}", std_metrics)
 
         # 3rd call should fail
         with pytest.raises(ValidationError, match="Maximum API calls"):
-            metrics = CostMetrics(
-                model="gemini-2.5-pro", input_tokens=100, output_tokens=50
-            )
-            tracker.record_call("agent_3", metrics)
+            tracker.record_call("agent_3", std_metrics)
 
-    def test_max_cost_exceeded(self):
+    def test_max_cost_exceeded(self, make_tracker):
         """Test that exceeding max cost raises error."""
-        tracker = CostTracker(max_cost_usd=0.0001, max_api_calls=10)
+        tracker = make_tracker(max_cost_usd=0.0001)
 
         # Try to record expensive call that exceeds budget
         with pytest.raises(ValidationError, match="Maximum cost.*would be exceeded"):
@@ -107,15 +114,12 @@ class TestCostTracker:
             )
             tracker.record_call("expensive_agent", metrics)
 
-    def test_get_summary(self):
+    def test_get_summary(self, make_tracker, std_metrics):
         """Test cost summary generation."""
-        tracker = CostTracker(max_cost_usd=1.0, max_api_calls=10)
+        tracker = make_tracker()
 
         # Record some calls
-        metrics1 = CostMetrics(
-            model="gemini-2.5-pro", input_tokens=1000, output_tokens=500
-        )
-        tracker.record_call("agent_1", metrics1)
+        tracker.record_call("agent_1", std_metrics)
 
         metrics2 = CostMetrics(model="gemini-2.5-flash-image")
         tracker.record_call("agent_2", metrics2)
@@ -148,9 +152,9 @@ class TestCostTracker:
         # Should include text and image costs
         assert estimated_cost > GEMINI_FLASH_IMAGE_PRICE
 
-    def test_warn_if_high_cost(self, capsys):
+    def test_warn_if_high_cost(self, capsys, make_tracker):
         """Test high cost warning."""
-        tracker = CostTracker(max_cost_usd=10.0, max_api_calls=100)
+        tracker = make_tracker(max_cost_usd=10.0, max_api_calls=100)
 
         # Record expensive call
         metrics = CostMetrics(
@@ -165,79 +169,93 @@ class TestCostTracker:
         assert "Warning" in captured.out or "⚠️" in captured.out
         assert "exceeds" in captured.out
 
-    def test_record_call_legacy_pattern(self):
-        """Test record_call with legacy CostMetrics pattern."""
-        tracker = CostTracker(max_cost_usd=1.0, max_api_calls=10)
-
-        metrics = CostMetrics(
-            model="gemini-2.5-pro", input_tokens=1000, output_tokens=500
-        )
-        tracker.record_call("test_agent", metrics)
+    def test_warn_if_high_cost_warns_once_per_threshold(
+        self, capsys, make_tracker, std_metrics
+    ):
+        """Test repeat checks stay quiet until a higher threshold is crossed."""
+        tracker = make_tracker()
+        tracker.record_call("agent", std_metrics)
 
-        assert tracker.api_call_count == 1
-        assert tracker.total_cost_usd > 0
-        assert "test_agent" in tracker.costs_by_agent
-
-    def test_record_call_positional_pattern(self):
-        """Test record_call with new positional arguments pattern."""
-        tracker = CostTracker(max_cost_usd=1.0, max_api_calls=10)
-
-        tracker.record_call("gemini-2.5-pro", 1000, 500, "test_agent")
-
-        assert tracker.api_call_count == 1
-        assert tracker.total_cost_usd > 0
-        assert "test_agent" in tracker.costs_by_agent
-
-    def test_record_call_keyword_pattern(self):
-        """Test record_call with pure keyword arguments pattern."""
-        tracker = CostTracker(max_cost_usd=1.0, max_api_calls=10)
-
-        tracker.record_call(
-            model="gemini-2.5-pro",
-            prompt_tokens=1000,
-            completion_tokens=500,
-            agent_name="test_agent",
-        )
-
-        assert tracker.api_call_count == 1
-        assert tracker.total_cost_usd > 0
-        assert "test_agent" in tracker.costs_by_agent
-
-    def test_record_call_mixed_keyword_pattern(self):
-        """Test record_call with mixed positional and keyword arguments."""
-        tracker = CostTracker(max_cost_usd=1.0, max_api_calls=10)
-
-        # First arg positional, rest as keywords
-        tracker.record_call(
-            "gemini-2.5-pro",
-            prompt_tokens=1000,
-            completion_tokens=500,
-            agent_name="test_agent",
-        )
+        tracker.warn_if_high_cost(threshold=0.001)
+        tracker.warn_if_high_cost(threshold=0.001)
+        tracker.warn_if_high_cost(threshold=0.0005)
+        assert capsys.readouterr().out.count("Warning") == 1
+
+        tracker.warn_if_high_cost(threshold=0.5)  # not yet exceeded
+        assert capsys.readouterr().out == ""
+
+        tracker.record_call("agent", CostMetrics(model="gemini-2.5-flash-image"))
+        tracker.warn_if_high_cost(threshold=0.1)
+        assert "exceeds $0.10" in capsys.readouterr().out
+
+    @pytest.mark.parametrize(
+        "call_args,call_kwargs",
+        [
+            pytest.param(
+                (
+                    "test_agent",
+                    CostMetrics(
+                        model="gemini-2.5-pro", input_tokens=1000, output_tokens=500
+                    ),
+                ),
+                {},
+                id="legacy",
+            ),
+            pytest.param(
+                ("gemini-2.5-pro", 1000, 500, "test_agent"), {}, id="positional"
+            ),
+            pytest.param(
+                (),
+                {
+                    "model": "gemini-2.5-pro",
+                    "prompt_tokens": 1000,
+                    "completion_tokens": 500,
+                    "agent_name": "test_agent",
+                },
+                id="keyword",
+            ),
+            pytest.param(
+                ("gemini-2.5-pro",),
+                {
+                    "prompt_tokens": 1000,
+                    "completion_tokens": 500,
+                    "agent_name": "test_agent",
+                },
+                id="mixed",
+            ),
+        ],
+    )
+    def test_record_call_patterns(
+        self, make_tracker, std_metrics, call_args, call_kwargs
+    ):
+        """Test every record_call calling pattern records the same call."""
+        tracker = make_tracker()
+
+        tracker.record_call(*call_args, **call_kwargs)
 
         assert tracker.api_call_count == 1
-        assert tracker.total_cost_usd > 0
-        assert "test_agent" in tracker.costs_by_agent
+        assert tracker.total_cost_usd == pytest.approx(std_metrics.cost_usd)
+        assert tracker.calls_by_agent == {"test_agent": 1}
 
-    def test_record_call_missing_model_raises_error(self):
+    def test_record_call_missing_model_raises_error(self, make_tracker):
         """Test that calling without model raises clear error."""
-        tracker = CostTracker(max_cost_usd=1.0, max_api_calls=10)
+        tracker = make_tracker()
 
         with pytest.raises(ValidationError, match="model must be provided"):
             tracker.record_call(prompt_tokens=1000, completion_tokens=500)
 
-    def test_record_call_missing_agent_name_raises_error(self):
+    def test_record_call_missing_agent_name_raises_error(self, make_tracker):
         """Test that calling without agent_name raises clear error."""
-        tracker = CostTracker(max_cost_usd=1.0, max_api_calls=10)
+        tracker = make_tracker()
 
         with pytest.raises(ValidationError, match="agent_name must be provided"):
             tracker.record_call(
                 model="gemini-2.5-pro", prompt_tokens=1000, completion_tokens=500
             )
 
-    def test_record_call_unsupported_kwargs_raises_error(self):
+    def test_record_call_unsupported_kwargs_raises_error(self, make_tracker):
         """Test that unsupported keyword arguments raise error."""
-        tracker = CostTracker(max_cost_usd=1.0, max_api_calls=10)
+        tracker = make_tracker()
 
         with pytest.raises(ValidationError, match="Unsupported keyword arguments"):
             tracker.record_call(
@@ -248,9 +266,9 @@ class TestCostTracker:
                 unsupported_arg="foo",
             )
 
-    def test_record_call_image_model_keyword(self):
+    def test_record_call_image_model_keyword(self, make_tracker):
         """Test record_call with image model using keyword pattern."""
-        tracker = CostTracker(max_cost_usd=1.0, max_api_calls=10)
+        tracker = make_tracker()
 
         tracker.record_call(
             model="gemini-2.5-flash-image",
@@ -1,62 +1,61 @@
 import os
 import sqlite3
-from time import sleep
+from contextlib import closing
+
+import pytest
 
 from database.init_db import (
     init_db,
     seed_potential_topics,
-    DEFAULT_SEED_ROWS,
+    DEFAULT_ROWS_BY_FIELD,
     DEFAULT_FIELD_DS,
     DEFAULT_FIELD_GAI,
 )
 from database.operations import (
     get_recent_topics,
     record_posted_topic,
+    record_posted_topics,
     select_new_topic,
 )
 
 
-def _all_previous_topics(db_path):
-    conn = sqlite3.connect(db_path)
-    try:
-        cur = conn.cursor()
-        cur.execute(
-            "SELECT topic_name, date_posted FROM previous_topics ORDER BY id ASC;"
-        )
-        return cur.fetchall()
-    finally:
-        conn.close()
+@pytest.fixture
+def db_conn(empty_db):
+    """One reader connection to ``empty_db``, reused for every check in a test."""
+    with closing(sqlite3.connect(empty_db, uri=empty_db.startswith("file:"))) as conn:
+        yield conn
 
 
-def test_record_and_get_recent_ordering(tmp_path):
-    db_path = os.path.join(tmp_path, "topics.db")
-    init_db(db_path)
+def _all_previous_topics(conn):
+    return conn.execute(
+        "SELECT topic_name, date_posted FROM previous_topics ORDER BY id ASC;"
+    ).fetchall()
+
+
+def test_record_and_get_recent_ordering(empty_db, db_conn):
+    db_path = empty_db
 
-    record_posted_topic("A", db_path=db_path)
-    sleep(0.01)
-    record_posted_topic("B", db_path=db_path)
-    sleep(0.01)
-    record_posted_topic("C", db_path=db_path)
+    # Explicit, increasing timestamps make the ordering deterministic
+    record_posted_topics(
+        ["A", "B", "C"],
+        ["2024-01-01T00:00:00Z", "2024-01-01T00:00:01Z", "2024-01-01T00:00:02Z"],
+        db_path=db_path,
+    )
 
     recent = get_recent_topics(limit=2, db_path=db_path)
     assert recent == ["C", "B"]
 
-    all_rows = _all_previous_topics(db_path)
+    all_rows = _all_previous_topics(db_conn)
     assert len(all_rows) == 3
     assert all_rows[0][0] == "A"
 
 
-def test_select_new_topic_excludes_recent_and_filters_by_field(tmp_path):
-    db_path = os.path.join(tmp_path, "topics.db")
-    init_db(db_path)
-
-    # Seed topics for both fields
-    seed_potential_topics(DEFAULT_SEED_ROWS, db_path)
+def test_select_new_topic_excludes_recent_and_filters_by_field(fresh_db):
+    # Seeded with topics for both fields
+    db_path = fresh_db
 
     # Pick one DS topic as recently posted
-    ds_topic = next(
-        name for name, field in DEFAULT_SEED_ROWS if field == DEFAULT_FIELD_DS
-    )
+    ds_topic = DEFAULT_ROWS_BY_FIELD[DEFAULT_FIELD_DS][0]
     record_posted_topic(ds_topic, db_path=db_path)
 
     # Should select a DS topic that is not the recently posted one
@@ -68,21 +67,17 @@ def test_select_new_topic_excludes_recent_and_filters_by_field(tmp_path):
     sel_gai = select_new_topic(DEFAULT_FIELD_GAI, recent_limit=10, db_path=db_path)
     assert sel_gai is not None
     # Ensure it comes from GAI set
-    gai_topics = [
-        name for name, field in DEFAULT_SEED_ROWS if field == DEFAULT_FIELD_GAI
-    ]
-    assert sel_gai["topic"] in gai_topics
+    assert sel_gai["topic"] in DEFAULT_ROWS_BY_FIELD[DEFAULT_FIELD_GAI]
 
 
-def test_record_posted_topic_iso_date_format(tmp_path):
+def test_record_posted_topic_iso_date_format(empty_db, db_conn):
     """Verify record_posted_topic writes ISO8601 formatted dates."""
-    db_path = os.path.join(tmp_path, "topics.db")
-    init_db(db_path)
+    db_path = empty_db
 
     # Record without explicit date (should use ISO8601 UTC)
     record_posted_topic("Test Topic", db_path=db_path)
 
-    all_rows = _all_previous_topics(db_path)
+    all_rows = _all_previous_topics(db_conn)
     assert len(all_rows) == 1
     topic_name, date_posted = all_rows[0]
     assert topic_name == "Test Topic"
@@ -94,22 +89,32 @@ def test_record_posted_topic_iso_date_format(tmp_path):
     custom_date = "2024-01-15T12:30:45Z"
     record_posted_topic("Another Topic", date_posted=custom_date, db_path=db_path)
 
-    all_rows = _all_previous_topics(db_path)
+    all_rows = _all_previous_topics(db_conn)
     assert len(all_rows) == 2
     assert all_rows[1][1] == custom_date
 
 
-def test_all_functions_accept_db_path_override(tmp_path):
-    """Verify all database operations accept db_path parameter for test isolation."""
-    db_path1 = os.path.join(tmp_path, "db1.db")
-    db_path2 = os.path.join(tmp_path, "db2.db")
+def test_record_posted_topics_defaults_and_length_check(empty_db, db_conn):
+    """Verify the batch insert fills missing dates and rejects mismatched lengths."""
+    custom_date = "2024-01-15T12:30:45Z"
+    record_posted_topics(["X", "Y"], [custom_date, None], db_path=empty_db)
+    record_posted_topics(["Z"], db_path=empty_db)
+
+    all_rows = _all_previous_topics(db_conn)
+    assert [name for name, _ in all_rows] == ["X", "Y", "Z"]
+    assert all_rows[0][1] == custom_date
+    assert all_rows[1][1].endswith("Z") and all_rows[2][1].endswith("Z")
+
+    with pytest.raises(ValueError):
+        record_posted_topics(["only one"], [custom_date, custom_date], db_path=empty_db)
+    assert len(_all_previous_topics(db_conn)) == 3
 
-    # Initialize two separate databases
-    init_db(db_path1)
-    init_db(db_path2)
 
-    # Seed only db1
-    seed_potential_topics(DEFAULT_SEED_ROWS, db_path1)
+def test_all_functions_accept_db_path_override(fresh_db, empty_db):
+    """Verify all database operations accept db_path parameter for test isolation."""
+    # Two separate databases; only db1 is seeded
+    db_path1 = fresh_db
+    db_path2 = empty_db
 
     # Record topic in db1
     record_posted_topic("Topic in DB1", db_path=db_path1)
@@ -129,3 +134,34 @@ def test_all_functions_accept_db_path_override(tmp_path):
 
     sel2 = select_new_topic(DEFAULT_FIELD_DS, recent_limit=10, db_path=db_path2)
     assert sel2 is None  # No seeded topics
+
+
+def test_functions_accept_shared_memory_uri():
+    """A "file:" db_path is opened as a SQLite URI (no file created on disk)."""
+    db_uri = "file:test_ops_uri?mode=memory&cache=shared"
+    keeper = sqlite3.connect(db_uri, uri=True)  # keeps the in-memory DB alive
+    try:
+        init_db(db_uri)
+        seed_potential_topics([("URI topic", DEFAULT_FIELD_GAI)], db_uri)
+        record_posted_topic("Posted via URI", db_path=db_uri)
+
+        assert get_recent_topics(limit=10, db_path=db_uri) == ["Posted via URI"]
+        assert select_new_topic(DEFAULT_FIELD_GAI, db_path=db_uri) == {
+            "topic": "URI topic"
+        }
+        assert not os.path.exists(db_uri)
+    finally:
+        keeper.close()
+
+
+def test_functions_accept_pathlib_db_path(tmp_path):
+    """A pathlib.Path db_path works the same as its string form."""
+    db_path = tmp_path / "nested" / "topics.db"
+    init_db(db_path)
+    seed_potential_topics([("Path topic", DEFAULT_FIELD_GAI)], db_path)
+    record_posted_topic("Posted via Path", db_path=db_path)
+
+    assert get_recent_topics(limit=10, db_path=db_path) == ["Posted via Path"]
+    assert select_new_topic(DEFAULT_FIELD_GAI, db_path=db_path) == {
+        "topic": "Path topic"
+    }
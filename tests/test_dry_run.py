@@ -12,11 +12,13 @@ Validates that dry-run mode:
 import json
 import pytest
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 
 from main import parse_args, run_pipeline
 from orchestrator import Orchestrator
 from core.dry_run import enable_dry_run, disable_dry_run, is_dry_run, reset_dry_run
+from core.errors import ModelError
 from core.llm_clients import GeminiTextClient, GeminiImageClient
 
 
@@ -55,14 +57,6 @@ class TestDryRunArgParsing:
 class TestDryRunContext:
     """Test dry-run context management."""
 
-    def setup_method(self):
-        """Reset dry-run state before each test."""
-        reset_dry_run()
-
-    def teardown_method(self):
-        """Reset dry-run state after each test."""
-        reset_dry_run()
-
     def test_enable_dry_run(self):
         """Test enabling dry-run mode."""
         assert is_dry_run() is False
@@ -87,14 +81,6 @@ class TestDryRunContext:
 class TestLLMClientDryRun:
     """Test that LLM clients respect dry-run mode."""
 
-    def setup_method(self):
-        """Reset dry-run state before each test."""
-        reset_dry_run()
-
-    def teardown_method(self):
-        """Reset dry-run state after each test."""
-        reset_dry_run()
-
     def test_text_client_dry_run_enabled(self):
         """Test that text generation returns mock response in dry-run mode."""
         enable_dry_run()
@@ -133,6 +119,28 @@ class TestLLMClientDryRun:
         # Should not have dry_run flag
         assert "dry_run" not in result or result.get("dry_run") is False
 
+    @pytest.mark.parametrize(
+        "candidates",
+        [
+            pytest.param([], id="no-candidates"),
+            pytest.param(
+                [SimpleNamespace(finish_reason=SimpleNamespace(name="MAX_TOKENS"))],
+                id="max-tokens",
+            ),
+        ],
+    )
+    @patch("google.generativeai.GenerativeModel")
+    def test_text_client_rejects_incomplete_reply(self, mock_model_class, candidates):
+        """Test empty or max-token-truncated replies raise a retryable ModelError."""
+        disable_dry_run()
+        mock_response = MagicMock(candidates=candidates)
+        mock_model_class.return_value.generate_content.return_value = mock_response
+
+        with pytest.raises(ModelError) as exc_info:
+            GeminiTextClient().generate_text(prompt="Test prompt")
+
+        assert exc_info.value.retryable is True
+
     def test_image_client_dry_run_enabled(self, tmp_path):
         """Test that image generation returns mock response in dry-run mode."""
         enable_dry_run()
@@ -154,13 +162,20 @@ class TestLLMClientDryRun:
 class TestOrchestratorDryRun:
     """Test orchestrator dry-run mode functionality."""
 
-    def setup_method(self):
-        """Reset dry-run state before each test."""
-        reset_dry_run()
+    @pytest.fixture(scope="class")
+    def dry_run_result(self, tmp_path_factory):
+        """Run the orchestrator in dry-run mode once for the output checks.
 
-    def teardown_method(self):
-        """Reset dry-run state after each test."""
-        reset_dry_run()
+        The working directory stays switched for the whole class, since
+        the returned run_path may be relative to it.
+        """
+        with pytest.MonkeyPatch.context() as mp:
+            mp.chdir(tmp_path_factory.mktemp("dry_run"))
+            config = {"field": "Data Science (Optimizations & Time-Series Analysis)"}
+            try:
+                yield Orchestrator(config, dry_run=True).run()
+            finally:
+                reset_dry_run()
 
     def test_orchestrator_accepts_dry_run_param(self):
         """Test that Orchestrator accepts dry_run parameter."""
@@ -179,13 +194,9 @@ class TestOrchestratorDryRun:
 
         assert is_dry_run() is True
 
-    def test_dry_run_creates_run_directory(self, tmp_path, monkeypatch):
+    def test_dry_run_creates_run_directory(self, dry_run_result):
         """Test that dry-run mode still creates run directory."""
-        monkeypatch.chdir(tmp_path)
-        config = {"field": "Data Science (Optimizations & Time-Series Analysis)"}
-        orchestrator = Orchestrator(config, dry_run=True)
-
-        result = orchestrator.run()
+        result = dry_run_result
 
         assert result["status"] == "success"
         assert result["mode"] == "dry_run"
@@ -196,13 +207,9 @@ class TestOrchestratorDryRun:
         run_path = Path(result["run_path"])
         assert run_path.exists()
 
-    def test_dry_run_creates_config_file(self, tmp_path, monkeypatch):
+    def test_dry_run_creates_config_file(self, dry_run_result):
         """Test that dry-run mode creates config file."""
-        monkeypatch.chdir(tmp_path)
-        config = {"field": "Data Science (Optimizations & Time-Series Analysis)"}
-        orchestrator = Orchestrator(config, dry_run=True)
-
-        result = orchestrator.run()
+        result = dry_run_result
 
         # Verify config file exists
         run_path = Path(result["run_path"])
@@ -211,15 +218,13 @@ class TestOrchestratorDryRun:
 
         # Verify config content
         saved_config = json.loads(config_file.read_text())
-        assert saved_config == config
+        assert saved_config == {
+            "field": "Data Science (Optimizations & Time-Series Analysis)"
+        }
 
-    def test_dry_run_generates_summary_file(self, tmp_path, monkeypatch):
+    def test_dry_run_generates_summary_file(self, dry_run_result):
         """Test that dry-run mode generates summary file."""
-        monkeypatch.chdir(tmp_path)
-        config = {"field": "Data Science (Optimizations & Time-Series Analysis)"}
-        orchestrator = Orchestrator(config, dry_run=True)
-
-        result = orchestrator.run()
+        result = dry_run_result
 
         # Verify summary file exists
         run_path = Path(result["run_path"])
@@ -233,13 +238,9 @@ class TestOrchestratorDryRun:
         assert "total_estimated_cost_usd" in summary
         assert "next_steps" in summary
 
-    def test_dry_run_estimates_costs(self, tmp_path, monkeypatch):
+    def test_dry_run_estimates_costs(self, dry_run_result):
         """Test that dry-run mode provides cost estimates."""
-        monkeypatch.chdir(tmp_path)
-        config = {"field": "Data Science (Optimizations & Time-Series Analysis)"}
-        orchestrator = Orchestrator(config, dry_run=True)
-
-        result = orchestrator.run()
+        result = dry_run_result
 
         assert "estimated_cost_usd" in result
         assert result["estimated_cost_usd"] > 0
@@ -252,13 +253,9 @@ class TestOrchestratorDryRun:
         assert "writer_agent" in summary["estimated_costs"]
         assert "image_generator_agent" in summary["estimated_costs"]
 
-    def test_dry_run_includes_next_steps(self, tmp_path, monkeypatch):
+    def test_dry_run_includes_next_steps(self, dry_run_result):
         """Test that dry-run summary includes next steps information."""
-        monkeypatch.chdir(tmp_path)
-        config = {"field": "Data Science (Optimizations & Time-Series Analysis)"}
-        orchestrator = Orchestrator(config, dry_run=True)
-
-        result = orchestrator.run()
+        result = dry_run_result
 
         summary = result["dry_run_summary"]
         assert "next_steps" in summary
@@ -270,14 +267,6 @@ class TestOrchestratorDryRun:
 class TestDryRunIntegration:
     """Integration tests for complete dry-run workflow."""
 
-    def setup_method(self):
-        """Reset dry-run state before each test."""
-        reset_dry_run()
-
-    def teardown_method(self):
-        """Reset dry-run state after each test."""
-        reset_dry_run()
-
     @pytest.mark.integration
     def test_full_dry_run_workflow(self, tmp_path, monkeypatch):
         """Test complete dry-run workflow from main entry point."""
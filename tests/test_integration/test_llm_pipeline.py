@@ -15,13 +15,13 @@ Line length violations are intentional for readability of test data.
 # flake8: noqa: E501
 
 import json
+import shutil
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 from orchestrator import Orchestrator
 from core.system_prompts import load_system_prompt
-from database.init_db import init_db, seed_potential_topics, DEFAULT_SEED_ROWS
 
 
 @pytest.fixture
@@ -259,17 +259,14 @@ def mock_config():
 
 
 @pytest.fixture
-def test_database(tmp_path):
-    """Fixture providing a temporary test database with schema and seed data."""
+def test_database(tmp_path, seeded_template_db):
+    """Fixture providing a temporary on-disk database with schema and seed data."""
     db_dir = tmp_path / "database"
     db_dir.mkdir(parents=True)
     db_path = str(db_dir / "topics.db")
 
-    # Initialize database schema
-    init_db(db_path)
-
-    # Seed with test data
-    seed_potential_topics(DEFAULT_SEED_ROWS, db_path)
+    # Copy the session-built seeded template instead of rebuilding it
+    shutil.copyfile(seeded_template_db, db_path)
 
     return db_path
 
@@ -597,32 +594,31 @@ class TestLLMPipelineIntegration:
     def test_database_fixture_works(self, test_database):
         """Verify the test database fixture creates a valid database."""
         import sqlite3
+        from contextlib import closing
 
         # Verify database file exists
         assert Path(test_database).exists()
 
-        # Verify tables exist
-        conn = sqlite3.connect(test_database)
-        cursor = conn.cursor()
-
-        # Check previous_topics table
-        cursor.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name='previous_topics'"
-        )
-        assert cursor.fetchone() is not None
-
-        # Check potential_topics table
-        cursor.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name='potential_topics'"
-        )
-        assert cursor.fetchone() is not None
-
-        # Check that seed data exists
-        cursor.execute("SELECT COUNT(*) FROM potential_topics")
-        count = cursor.fetchone()[0]
-        assert count > 0, "Database should have seed data"
-
-        conn.close()
+        # Verify tables exist; closing() releases the file even on failure
+        with closing(sqlite3.connect(test_database)) as conn:
+            cursor = conn.cursor()
+
+            # Check previous_topics table
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type='table' AND name='previous_topics'"
+            )
+            assert cursor.fetchone() is not None
+
+            # Check potential_topics table
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type='table' AND name='potential_topics'"
+            )
+            assert cursor.fetchone() is not None
+
+            # Check that seed data exists
+            cursor.execute("SELECT COUNT(*) FROM potential_topics")
+            count = cursor.fetchone()[0]
+            assert count > 0, "Database should have seed data"
 
     def test_system_prompts_loaded_correctly(self):
         """Verify system prompts can be loaded from system_prompts.md."""
@@ -23,7 +23,6 @@ from core.retry import CircuitBreakerTrippedError
 from core.envelope import ok, err
 from core.fallback_tracker import FallbackTracker
 
-
 # Fixtures
 
 
@@ -498,6 +497,38 @@ def test_character_count_loop_max_iterations_exceeded(orchestrator_with_config):
     assert orchestrator_with_config.metrics["char_loop_iterations"] == 5
 
 
+@pytest.mark.parametrize(
+    "score, skips_review", [(0.9, True), (0.5, False), (None, False)]
+)
+def test_self_critique_score_gates_llm_review(valid_config, score, skips_review):
+    """Test a confident self-critiqued draft skips the reviewer's LLM pass."""
+    orchestrator = Orchestrator({**valid_config, "self_critique": True})
+    orchestrator.run_id = "test-run"
+    orchestrator.run_path = Path("/tmp/test-run")
+
+    short_text = "A" * 2000
+    agent_inputs = {}
+
+    def mock_agent_call(agent_name, agent_fn, input_obj):
+        agent_inputs[agent_name] = input_obj
+        if agent_name == "writer_agent":
+            return ok({"draft_path": "40_draft.md", "self_critique_score": score})
+        return ok({"revised": short_text})
+
+    with (
+        patch.object(
+            orchestrator, "_execute_agent_with_retry", side_effect=mock_agent_call
+        ),
+        patch("orchestrator.Path.read_text", return_value=short_text),
+        patch("orchestrator.atomic_write_text"),
+        patch("orchestrator.log_event"),
+    ):
+        orchestrator._execute_writing_and_review_loop({"topic": "test"})
+
+    assert agent_inputs["writer_agent"]["self_critique"] is True
+    assert agent_inputs["reviewer_agent"].get("skip_llm_review", False) is skips_review
+
+
 # Test Suite: Run Completion & Error Handling (5.6)
 
 
@@ -6,8 +6,6 @@ and that legitimate errors are not silently swallowed.
 """
 
 import logging
-import shutil
-import tempfile
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
@@ -23,11 +21,9 @@ from core.rag_setup import (
 
 
 @pytest.fixture
-def temp_dir():
+def temp_dir(tmp_path):
     """Create a temporary directory for tests."""
-    temp_path = tempfile.mkdtemp()
-    yield temp_path
-    shutil.rmtree(temp_path, ignore_errors=True)
+    return str(tmp_path)
 
 
 @pytest.fixture
@@ -2,6 +2,9 @@
 Tests for system prompt loader utility.
 """
 
+from pathlib import Path
+from unittest.mock import patch
+
 import pytest
 from core.system_prompts import load_system_prompt, clear_cache
 
@@ -63,6 +66,18 @@ class TestSystemPromptLoader:
         assert prompt1 == prompt2
         assert prompt1 is prompt2  # Same object reference (cached)
 
+    def test_file_read_once_across_sections(self):
+        """Test that loading several sections reads system_prompts.md once."""
+        read_text = Path.read_text
+        with patch.object(
+            Path, "read_text", autospec=True, side_effect=read_text
+        ) as spy:
+            load_system_prompt("witty_expert")
+            load_system_prompt("visual_strategist")
+            load_system_prompt("strategic_content_architect")
+
+        assert spy.call_count == 1
+
     def test_clear_cache(self):
         """Test cache clearing."""
         # Load and cache